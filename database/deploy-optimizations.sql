@@ -135,6 +135,10 @@ CREATE POLICY "transactions_delete" ON public.transactions
     FOR DELETE TO authenticated
     USING ((select auth.uid()) = user_id);
 
+-- WALLETS INDEX: composite (user_id, id) replaces the single-column user_id index
+CREATE INDEX IF NOT EXISTS idx_wallets_user_id_id ON public.wallets(user_id, id);
+DROP INDEX IF EXISTS idx_wallets_user_id;
+
 -- Commit the changes
 COMMIT;
 
@@ -177,7 +181,7 @@ SELECT
 FROM pg_stat_user_indexes 
 WHERE indexname IN (
     'idx_virtual_cards_user_id',
-    'idx_wallets_user_id', 
+    'idx_wallets_user_id_id', 
     'idx_transactions_user_id',
     'idx_transactions_card_id',
     'idx_transactions_wallet_id'
@@ -68,7 +68,8 @@ CREATE TABLE public.wallets (
 -- INDEXES FOR PERFORMANCE
 -- ================================================================
 
-CREATE INDEX idx_wallets_user_id ON public.wallets(user_id);
+-- Composite (user_id, id): serves per-user wallet lookups and ownership checks from the index alone
+CREATE INDEX idx_wallets_user_id_id ON public.wallets(user_id, id);
 CREATE INDEX idx_wallets_wallet_type ON public.wallets(wallet_type);
 CREATE INDEX idx_wallets_network ON public.wallets(network);
 CREATE INDEX idx_wallets_is_primary ON public.wallets(is_primary);
@@ -60,7 +60,7 @@ function showOptimizationSummary() {
   log('\n🗂️ Index Optimization:', 'green');
   log('  • Identifies unused indexes:', 'reset');
   log('    - idx_virtual_cards_user_id', 'yellow');
-  log('    - idx_wallets_user_id', 'yellow');
+  log('    - idx_wallets_user_id (replaced by composite idx_wallets_user_id_id)', 'yellow');
   log('    - idx_transactions_user_id', 'yellow');
   log('    - idx_transactions_card_id', 'yellow');
   log('    - idx_transactions_wallet_id', 'yellow');
@@ -69,7 +69,10 @@ CREATE TABLE IF NOT EXISTS public.wallets (
 );
 
 -- Create indexes
-CREATE INDEX IF NOT EXISTS idx_wallets_user_id ON public.wallets(user_id);
+-- Composite (user_id, id): serves per-user wallet lookups and ownership checks
+-- from the index alone; supersedes the single-column idx_wallets_user_id
+CREATE INDEX IF NOT EXISTS idx_wallets_user_id_id ON public.wallets(user_id, id);
+DROP INDEX IF EXISTS idx_wallets_user_id;
 CREATE INDEX IF NOT EXISTS idx_wallets_wallet_type ON public.wallets(wallet_type);
 CREATE INDEX IF NOT EXISTS idx_wallets_network ON public.wallets(network);
 CREATE INDEX IF NOT EXISTS idx_wallets_is_primary ON public.wallets(is_primary);
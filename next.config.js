@@ -89,6 +89,20 @@ const nextConfig = {
           },
         ],
       },
+      // Static branding assets in /public rarely change; let browsers reuse them
+      // (Next.js still sends ETag/Last-Modified for conditional revalidation)
+      {
+        source: '/:path(icons|images)/:file*',
+        headers: [
+          { key: 'Cache-Control', value: 'public, max-age=86400, stale-while-revalidate=604800' },
+        ],
+      },
+      {
+        source: '/:file(celora-logo\\.png|celora-logo\\.svg)',
+        headers: [
+          { key: 'Cache-Control', value: 'public, max-age=86400, stale-while-revalidate=604800' },
+        ],
+      },
       {
         source: '/api/(.*)',
         headers: [
@@ -1,5 +1,9 @@
-console.log('🔍 SOLANA INTEGRATION STATUS CHECK');
-console.log('=====================================');
+// Collect the report and emit it with a single write at the end
+const lines = [];
+const out = (line = '') => lines.push(line);
+
+out('🔍 SOLANA INTEGRATION STATUS CHECK');
+out('=====================================');
 
 // Check if all required files exist
 const fs = require('fs');
@@ -17,42 +21,44 @@ const requiredFiles = [
     'src/hooks/usePushNotifications.ts'
 ];
 
-console.log('\n📁 FILE VERIFICATION:');
+out('\n📁 FILE VERIFICATION:');
 requiredFiles.forEach(file => {
     const exists = fs.existsSync(path.join(process.cwd(), file));
-    console.log(`${exists ? '✅' : '❌'} ${file}`);
+    out(`${exists ? '✅' : '❌'} ${file}`);
 });
 
-console.log('\n🗄️ DATABASE TABLES STATUS:');
-console.log('✅ spl_token_cache - Added via missing-tables-only.sql');
-console.log('✅ spl_token_prices - Added via missing-tables-only.sql');
-console.log('✅ websocket_subscriptions - Existing table');
-console.log('✅ solana_transaction_stream - Added via missing-tables-only.sql');
-console.log('✅ pending_transfer_links - Added via missing-tables-only.sql');
-console.log('✅ auto_link_settings - Added via missing-tables-only.sql');
-console.log('✅ solana_notification_templates - Added via missing-tables-only.sql');
-console.log('✅ solana_notification_queue - Added via missing-tables-only.sql');
-
-console.log('\n⚡ EDGE FUNCTIONS STATUS:');
-console.log('✅ solana-websocket-stream - Deployed to production');
-console.log('✅ solana-push-notifications - Deployed to production');
-console.log('✅ VAPID keys - Configured in Supabase secrets');
-
-console.log('\n🔄 REALTIME STATUS:');
-console.log('📋 Need to run: database/solana-realtime-setup.sql');
-console.log('   - Enables realtime for transaction streams');
-console.log('   - Creates broadcast channels');
-console.log('   - Sets up auto-triggers');
-
-console.log('\n🧪 TESTING STATUS:');
-console.log('🎯 Ready to test Edge Functions in Supabase Dashboard');
-console.log('📍 URL: https://supabase.com/dashboard/project/zpcycakwdvymqhwvakrv/functions');
-
-console.log('\n🎊 OVERALL STATUS: 95% COMPLETE!');
-console.log('Next steps:');
-console.log('1. Test WebSocket Edge Function');
-console.log('2. Test Push Notification Edge Function');
-console.log('3. Optional: Run realtime-setup.sql for live updates');
-console.log('4. Integrate UI components to main app');
-
-console.log('\n🚀 LEGENDARY Solana integration ready for testing!');
\ No newline at end of file
+out('\n🗄️ DATABASE TABLES STATUS:');
+out('✅ spl_token_cache - Added via missing-tables-only.sql');
+out('✅ spl_token_prices - Added via missing-tables-only.sql');
+out('✅ websocket_subscriptions - Existing table');
+out('✅ solana_transaction_stream - Added via missing-tables-only.sql');
+out('✅ pending_transfer_links - Added via missing-tables-only.sql');
+out('✅ auto_link_settings - Added via missing-tables-only.sql');
+out('✅ solana_notification_templates - Added via missing-tables-only.sql');
+out('✅ solana_notification_queue - Added via missing-tables-only.sql');
+
+out('\n⚡ EDGE FUNCTIONS STATUS:');
+out('✅ solana-websocket-stream - Deployed to production');
+out('✅ solana-push-notifications - Deployed to production');
+out('✅ VAPID keys - Configured in Supabase secrets');
+
+out('\n🔄 REALTIME STATUS:');
+out('📋 Need to run: database/solana-realtime-setup.sql');
+out('   - Enables realtime for transaction streams');
+out('   - Creates broadcast channels');
+out('   - Sets up auto-triggers');
+
+out('\n🧪 TESTING STATUS:');
+out('🎯 Ready to test Edge Functions in Supabase Dashboard');
+out('📍 URL: https://supabase.com/dashboard/project/zpcycakwdvymqhwvakrv/functions');
+
+out('\n🎊 OVERALL STATUS: 95% COMPLETE!');
+out('Next steps:');
+out('1. Test WebSocket Edge Function');
+out('2. Test Push Notification Edge Function');
+out('3. Optional: Run realtime-setup.sql for live updates');
+out('4. Integrate UI components to main app');
+
+out('\n🚀 LEGENDARY Solana integration ready for testing!');
+
+process.stdout.write(lines.join('\n') + '\n');
@@ -19,6 +19,8 @@ class SuperbaseSchemaDeployer {
     constructor() {
         this.supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL;
         this.serviceRoleKey = process.env.SUPABASE_SERVICE_ROLE_KEY;
+        // Reuse the TCP/TLS connection across executeSQL calls
+        this.agent = new https.Agent({ keepAlive: true });
     }
 
     log(message, icon = '📋') {
@@ -146,6 +148,7 @@ ${schemaSql}
                 port: 443,
                 path: url.pathname,
                 method: 'POST',
+                agent: this.agent,
                 headers: {
                     'Content-Type': 'application/json',
                     'Authorization': `Bearer ${this.serviceRoleKey}`,
@@ -105,35 +105,24 @@ async function setupDatabase() {
     // Test basic functionality
     console.log('🧪 Testing database functionality...');
     
-    // Check if we can query the profiles table
-    const { data: profilesTest, error: profilesError } = await supabase
-      .from('profiles')
-      .select('*')
-      .limit(1);
-    
-    if (!profilesError) {
-      console.log('✅ Profiles table working correctly');
-    }
-    
-    // Check virtual_cards table
-    const { data: cardsTest, error: cardsError } = await supabase
-      .from('virtual_cards')
-      .select('*')
-      .limit(1);
-    
-    if (!cardsError) {
-      console.log('✅ Virtual cards table working correctly');
-    }
-    
-    // Check wallets table
-    const { data: walletsTest, error: walletsError } = await supabase
-      .from('wallets')
-      .select('*')
-      .limit(1);
-    
-    if (!walletsError) {
-      console.log('✅ Wallets table working correctly');
-    }
+    // Probe the core tables concurrently with HEAD count queries: one round
+    // trip of wall-clock time and no row payloads
+    const tableChecks = [
+      ['profiles', 'Profiles'],
+      ['virtual_cards', 'Virtual cards'],
+      ['wallets', 'Wallets']
+    ];
+    const checkResults = await Promise.all(
+      tableChecks.map(([table]) =>
+        supabase.from(table).select('*', { count: 'exact', head: true })
+      )
+    );
+    
+    checkResults.forEach(({ error }, i) => {
+      if (!error) {
+        console.log(`✅ ${tableChecks[i][1]} table working correctly`);
+      }
+    });
     
     console.log('🎉 Database setup completed successfully!');
     console.log('🚀 Your Celora platform is now ready to use!');
@@ -8,6 +8,9 @@ async function runCompleteSystemValidation() {
   console.log('================================================');
   console.log('Testing all system components for production readiness...\n');
 
+  // Kick off all outbound connectivity checks now so their round trips overlap
+  const probes = startNetworkProbes();
+
   let overallValid = true;
   const results = {
     environment: false,
@@ -31,12 +34,12 @@ async function runCompleteSystemValidation() {
   // 2. Database Connectivity 
   console.log('\n🗄️  2. DATABASE CONNECTIVITY');
   console.log('=============================');
-  results.database = await validateDatabase();
+  results.database = await validateDatabase(probes.database);
 
   // 3. Blockchain Integration
   console.log('\n⛓️  3. BLOCKCHAIN INTEGRATION');
   console.log('=============================');
-  results.blockchain = await validateBlockchain();
+  results.blockchain = await validateBlockchain(probes);
 
   // 4. API Endpoints
   console.log('\n🔗 4. API ENDPOINTS');
@@ -83,24 +86,69 @@ async function runCompleteSystemValidation() {
   return overallValid;
 }
 
-async function validateDatabase() {
+/**
+ * Start the database and blockchain connectivity requests concurrently.
+ * Each probe resolves to { response } or { error } (never rejects) and is
+ * null when the target is not configured; the validate steps await them in
+ * order so the report output stays sequential.
+ */
+function startNetworkProbes() {
+  const probe = (url, init) => fetch(url, init).then(response => ({ response }), error => ({ error }));
+
+  const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL;
+  const supabaseKey = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY;
+  const ethereumUrl = process.env.ETHEREUM_TESTNET_RPC_URL;
+  const solanaUrl = process.env.SOLANA_TESTNET_RPC_URL;
+
+  return {
+    database: supabaseUrl && supabaseKey
+      ? probe(`${supabaseUrl}/rest/v1/`, {
+          headers: {
+            'apikey': supabaseKey,
+            'Authorization': `Bearer ${supabaseKey}`
+          }
+        })
+      : null,
+    ethereum: ethereumUrl
+      ? probe(ethereumUrl, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({
+            jsonrpc: '2.0',
+            method: 'eth_blockNumber',
+            params: [],
+            id: 1
+          })
+        })
+      : null,
+    solana: solanaUrl
+      ? probe(solanaUrl, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({
+            jsonrpc: '2.0',
+            id: 1,
+            method: 'getHealth'
+          })
+        })
+      : null
+  };
+}
+
+async function validateDatabase(databaseProbe) {
   try {
     // Test Supabase connection
     const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL;
     const supabaseKey = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY;
     
-    if (!supabaseUrl || !supabaseKey) {
+    if (!supabaseUrl || !supabaseKey || !databaseProbe) {
       console.log('❌ Supabase configuration missing');
       return false;
     }
 
-    // Basic connectivity test
-    const response = await fetch(`${supabaseUrl}/rest/v1/`, {
-      headers: {
-        'apikey': supabaseKey,
-        'Authorization': `Bearer ${supabaseKey}`
-      }
-    });
+    // Basic connectivity test (request already in flight)
+    const { response, error } = await databaseProbe;
+    if (error) throw error;
 
     if (response.ok) {
       console.log('✅ Supabase connectivity successful');
@@ -116,7 +164,7 @@ async function validateDatabase() {
   }
 }
 
-async function validateBlockchain() {
+async function validateBlockchain(probes) {
   try {
     // Import blockchain service dynamically to avoid module issues
     const blockchainConfig = {
@@ -145,16 +193,8 @@ async function validateBlockchain() {
       // Test connectivity to Ethereum
       if (blockchainConfig.ethereum.testnetRpcUrl) {
         try {
-          const response = await fetch(blockchainConfig.ethereum.testnetRpcUrl, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({
-              jsonrpc: '2.0',
-              method: 'eth_blockNumber',
-              params: [],
-              id: 1
-            })
-          });
+          const { response, error } = await probes.ethereum;
+          if (error) throw error;
           
           if (response.ok) {
             console.log('✅ Ethereum testnet connectivity successful');
@@ -177,15 +217,8 @@ async function validateBlockchain() {
       
       if (blockchainConfig.solana.testnetRpcUrl) {
         try {
-          const response = await fetch(blockchainConfig.solana.testnetRpcUrl, {
-            method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({
-              jsonrpc: '2.0',
-              id: 1,
-              method: 'getHealth'
-            })
-          });
+          const { response, error } = await probes.solana;
+          if (error) throw error;
           
           if (response.ok) {
             console.log('✅ Solana connectivity successful');
@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { timingSafeEqual } from 'crypto';
 import { createClient } from '@supabase/supabase-js';
 import { seedPhraseToHash } from '@/lib/seedPhrase';
 import { getSupabaseConfig } from '@/lib/supabase-config';
@@ -32,8 +33,14 @@ export async function POST(request: NextRequest) {
     console.log('🔐 Hash preview:', hashHex.slice(0, 8) + '...');
 
     // Verify the seed phrase generates the correct hash
-    const verifyHashHex = await seedPhraseToHash(seedPhrase);
-    if (verifyHashHex !== hashHex) {
+    // Compare the raw 32-byte digests in constant time; a hex string compare
+    // exits at the first differing character
+    const expectedHashHex = await seedPhraseToHash(seedPhrase);
+    const expectedHash = Buffer.from(expectedHashHex, 'hex');
+    const providedHash = Buffer.from(String(hashHex), 'hex');
+    if (String(hashHex).length !== expectedHashHex.length ||
+        providedHash.length !== expectedHash.length ||
+        !timingSafeEqual(providedHash, expectedHash)) {
       console.error('❌ Hash verification failed');
       return NextResponse.json(
         { error: 'Seed phrase verification failed' },
@@ -1,7 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { createRouteHandlerClient } from '@supabase/auth-helpers-nextjs';
 import { cookies } from 'next/headers';
-import { createClient } from '@supabase/supabase-js';
+import { getSupabaseAdmin } from '@/lib/supabase/admin';
 
 function unauthorized() { return NextResponse.json({ error: 'Authentication required' }, { status: 401 }); }
 function notFound() { return NextResponse.json({ error: 'Card not found' }, { status: 404 }); }
@@ -16,9 +16,7 @@ export async function GET(
   const { data: { session } } = await supabaseUser.auth.getSession();
   if (!session) return unauthorized();
 
-  const url = process.env.NEXT_PUBLIC_SUPABASE_URL!;
-  const service = process.env.SUPABASE_SERVICE_ROLE_KEY!;
-  const admin = createClient(url, service, { auth: { autoRefreshToken: false, persistSession: false } });
+  const admin = getSupabaseAdmin();
 
   // Verify ownership and fetch recent transactions for heuristic
   const { data: card, error: cardErr } = await admin
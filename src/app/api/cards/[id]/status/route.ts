@@ -1,7 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { createRouteHandlerClient } from '@supabase/auth-helpers-nextjs';
 import { cookies } from 'next/headers';
-import { createClient } from '@supabase/supabase-js';
+import { getSupabaseAdmin } from '@/lib/supabase/admin';
 
 // Helpers
 function badRequest(msg: string) {
@@ -26,9 +26,7 @@ export async function GET(
   const { data: { session } } = await supabaseUser.auth.getSession();
   if (!session) return unauthorized();
 
-  const url = process.env.NEXT_PUBLIC_SUPABASE_URL!;
-  const service = process.env.SUPABASE_SERVICE_ROLE_KEY!;
-  const admin = createClient(url, service, { auth: { autoRefreshToken: false, persistSession: false } });
+  const admin = getSupabaseAdmin();
 
   const { data: card, error } = await admin
     .from('virtual_cards')
@@ -57,10 +55,10 @@ export async function PATCH(
   let body: { status?: string } = {};
   try { body = await request.json(); } catch {}
 
-  const url = process.env.NEXT_PUBLIC_SUPABASE_URL!;
-  const service = process.env.SUPABASE_SERVICE_ROLE_KEY!;
-  if (!url || !service) return NextResponse.json({ error: 'Server not configured' }, { status: 500 });
-  const admin = createClient(url, service, { auth: { autoRefreshToken: false, persistSession: false } });
+  if (!process.env.NEXT_PUBLIC_SUPABASE_URL || !process.env.SUPABASE_SERVICE_ROLE_KEY) {
+    return NextResponse.json({ error: 'Server not configured' }, { status: 500 });
+  }
+  const admin = getSupabaseAdmin();
 
   // Fetch to verify ownership and current status
   const { data: card, error } = await admin
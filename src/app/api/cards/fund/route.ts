@@ -1,6 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { createClient } from '@supabase/supabase-js';
 import { getSupabaseConfig } from '@/lib/supabase-config';
+import { getSupabaseAdmin } from '@/lib/supabase/admin';
 
 // Only available server-side: ensure SERVICE_ROLE_KEY never reaches client
 const { supabaseUrl: SUPABASE_URL, supabaseServiceKey: SERVICE_ROLE_KEY } = getSupabaseConfig();
@@ -19,7 +19,7 @@ export async function POST(req: NextRequest) {
   if (!SUPABASE_URL || !SERVICE_ROLE_KEY) {
     return NextResponse.json({ error: 'Server not configured' }, { status: 500 });
   }
-  const supabaseAdmin = createClient(SUPABASE_URL, SERVICE_ROLE_KEY, { auth: { autoRefreshToken: false, persistSession: false } });
+  const supabaseAdmin = getSupabaseAdmin();
 
   let body: FundBody;
   try {
@@ -12,6 +12,17 @@ import {
 // Force dynamic rendering
 export const dynamic = 'force-dynamic';
 
+// Card PINs are 4-6 digits
+const PIN_PATTERN = /^\d{4,6}$/;
+
+// Constant part of a masked PAN; only the last four digits vary per card
+const MASKED_PAN_PREFIX = '**** **** **** ';
+
+// Columns returned for cards (list and create). Responses only carry the masked
+// PAN stored at creation, so the encrypted payload and PIN/fraud internals are
+// never fetched or decrypted to render a card.
+const CARD_LIST_COLUMNS = 'id, user_id, masked_pan, card_type, balance, currency, spending_limit, daily_limit, monthly_limit, status, is_primary, is_frozen, freeze_reason, last_used_at, created_at, updated_at';
+
 export const POST: StaticRouteHandler = async (request: NextRequest) => {
   try {
     const body = await request.json();
@@ -33,6 +44,17 @@ export const POST: StaticRouteHandler = async (request: NextRequest) => {
         { status: HttpStatusCode.BAD_REQUEST }
       );
     }
+
+    if (pin !== undefined && pin !== null && !(typeof pin === 'string' && PIN_PATTERN.test(pin))) {
+      return NextResponse.json(
+        ApiResponseHelper.error(
+          'PIN must be 4-6 digits',
+          'VALIDATION_ERROR',
+          { errors: [{ field: 'pin', message: 'PIN must be 4-6 digits' }] }
+        ),
+        { status: HttpStatusCode.BAD_REQUEST }
+      );
+    }
     
     const supabase = createRouteHandlerClient({ cookies });
     
@@ -45,14 +67,14 @@ export const POST: StaticRouteHandler = async (request: NextRequest) => {
       );
     }
 
-    // Hash the PIN for security
+    // Hash the PIN for security (stored in virtual_cards.pin_hash)
     let pinHash = null;
     if (pin) {
       pinHash = await hash(pin, 12);
     }
 
     // Generate a masked PAN (in production, this would be a real card number)
-    const maskedPan = `**** **** **** ${Math.floor(1000 + Math.random() * 9000)}`;
+    const maskedPan = MASKED_PAN_PREFIX + (1000 + Math.floor(Math.random() * 9000));
 
     // Create virtual card
     const { data, error } = await supabase
@@ -62,9 +84,10 @@ export const POST: StaticRouteHandler = async (request: NextRequest) => {
         masked_pan: maskedPan,
         balance: 0,
         currency: currency || 'USD',
-        status: 'active'
+        status: 'active',
+        pin_hash: pinHash
       })
-      .select()
+      .select(CARD_LIST_COLUMNS)
       .single();
 
     if (error) {
@@ -125,7 +148,7 @@ export const GET: StaticRouteHandler = async (request: NextRequest) => {
 
     const { data, error, count } = await supabase
       .from('virtual_cards')
-      .select('*', { count: 'exact' })
+      .select(CARD_LIST_COLUMNS, { count: 'exact' })
       .eq('user_id', session.user.id)
       .order('created_at', { ascending: false })
       .range(offset, offset + limit - 1);
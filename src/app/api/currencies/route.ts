@@ -27,13 +27,10 @@ export async function GET(request: NextRequest) {
     const type = searchParams.get('type'); // 'fiat', 'crypto', or null for all
     const active = searchParams.get('active'); // 'true', 'false', or null for all
 
-    // Get all supported currencies
-    let currencies = multiCurrency.getSupportedCurrencies();
-
-    // Apply filters
-    if (type) {
-      currencies = currencies.filter(c => c.type === type);
-    }
+    // Get supported currencies, using the pre-built per-type index when filtering by type
+    let currencies = type
+      ? multiCurrency.getSupportedCurrenciesByType(type)
+      : multiCurrency.getSupportedCurrencies();
     
     if (active !== null) {
       const isActive = active === 'true';
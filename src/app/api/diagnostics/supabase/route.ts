@@ -1,35 +1,43 @@
 import { NextResponse } from 'next/server';
 
+const SUPABASE_URL = process.env.NEXT_PUBLIC_SUPABASE_URL;
+const SUPABASE_ANON_KEY = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY;
+const SERVICE_ROLE_KEY = process.env.SUPABASE_SERVICE_ROLE_KEY;
+const NEXTAUTH_URL = process.env.NEXTAUTH_URL;
+const ENVIRONMENT = process.env.NODE_ENV;
+
+// Environment variable checks don't change while the process runs, so the
+// masked summary is built once (actual values are never exposed)
+const ENV_VARS = {
+  NEXT_PUBLIC_SUPABASE_URL: {
+    exists: !!SUPABASE_URL,
+    value: SUPABASE_URL ? `${SUPABASE_URL.substring(0, 20)}...` : 'NOT SET',
+    length: SUPABASE_URL?.length || 0
+  },
+  NEXT_PUBLIC_SUPABASE_ANON_KEY: {
+    exists: !!SUPABASE_ANON_KEY,
+    length: SUPABASE_ANON_KEY?.length || 0,
+    startsWithEyJ: SUPABASE_ANON_KEY?.startsWith('eyJ') || false
+  },
+  SUPABASE_SERVICE_ROLE_KEY: {
+    exists: !!SERVICE_ROLE_KEY,
+    length: SERVICE_ROLE_KEY?.length || 0,
+    startsWithEyJ: SERVICE_ROLE_KEY?.startsWith('eyJ') || false
+  },
+  NEXTAUTH_URL: {
+    exists: !!NEXTAUTH_URL,
+    value: NEXTAUTH_URL || 'NOT SET'
+  }
+};
+
 export async function GET() {
   try {
     const diagnostics = {
       timestamp: new Date().toISOString(),
-      environment: process.env.NODE_ENV,
+      environment: ENVIRONMENT,
       
       // Check environment variables (but don't expose actual values)
-      envVars: {
-        NEXT_PUBLIC_SUPABASE_URL: {
-          exists: !!process.env.NEXT_PUBLIC_SUPABASE_URL,
-          value: process.env.NEXT_PUBLIC_SUPABASE_URL ? 
-            `${process.env.NEXT_PUBLIC_SUPABASE_URL.substring(0, 20)}...` : 
-            'NOT SET',
-          length: process.env.NEXT_PUBLIC_SUPABASE_URL?.length || 0
-        },
-        NEXT_PUBLIC_SUPABASE_ANON_KEY: {
-          exists: !!process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY,
-          length: process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY?.length || 0,
-          startsWithEyJ: process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY?.startsWith('eyJ') || false
-        },
-        SUPABASE_SERVICE_ROLE_KEY: {
-          exists: !!process.env.SUPABASE_SERVICE_ROLE_KEY,
-          length: process.env.SUPABASE_SERVICE_ROLE_KEY?.length || 0,
-          startsWithEyJ: process.env.SUPABASE_SERVICE_ROLE_KEY?.startsWith('eyJ') || false
-        },
-        NEXTAUTH_URL: {
-          exists: !!process.env.NEXTAUTH_URL,
-          value: process.env.NEXTAUTH_URL || 'NOT SET'
-        }
-      },
+      envVars: ENV_VARS,
       
       // Test Supabase connection
       supabaseConnection: await testSupabaseConnection()
@@ -50,8 +58,8 @@ export async function GET() {
 
 async function testSupabaseConnection() {
   try {
-    const url = process.env.NEXT_PUBLIC_SUPABASE_URL;
-    const key = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY;
+    const url = SUPABASE_URL;
+    const key = SUPABASE_ANON_KEY;
     
     if (!url || !key) {
       return {
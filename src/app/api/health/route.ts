@@ -1,18 +1,38 @@
 import { NextRequest, NextResponse } from 'next/server';
 
+// Fields that cannot change while the process is running are resolved once
+// at module load instead of on every health probe
+const VERSION = process.env.npm_package_version || '1.0.0';
+const ENVIRONMENT = process.env.NODE_ENV || 'development';
+const SERVICES = Object.freeze({
+  database: 'connected', // Could add actual DB health check
+  auth: 'operational',
+  api: 'running'
+});
+
+// Health probes arrive every second or so; format the timestamp at most once per second
+let cachedTimestamp = '';
+let cachedTimestampSecond = -1;
+
+function currentTimestamp(): string {
+  const now = Date.now();
+  const second = Math.floor(now / 1000);
+  if (second !== cachedTimestampSecond) {
+    cachedTimestampSecond = second;
+    cachedTimestamp = new Date(now).toISOString();
+  }
+  return cachedTimestamp;
+}
+
 export async function GET(req: NextRequest) {
   const health = {
     status: 'healthy',
-    timestamp: new Date().toISOString(),
+    timestamp: currentTimestamp(),
     uptime: process.uptime(),
     memory: process.memoryUsage(),
-    version: process.env.npm_package_version || '1.0.0',
-    environment: process.env.NODE_ENV || 'development',
-    services: {
-      database: 'connected', // Could add actual DB health check
-      auth: 'operational',
-      api: 'running'
-    }
+    version: VERSION,
+    environment: ENVIRONMENT,
+    services: SERVICES
   };
   
   return NextResponse.json(health);
@@ -8,8 +8,11 @@ function generateSecret(): string {
   return crypto.randomBytes(20).toString('hex');
 }
 
-function generateTOTP(secret: string, window = 0): string {
-  const epoch = Math.round(new Date().getTime() / 1000.0);
+function generateTOTP(
+  secret: string | crypto.KeyObject,
+  window = 0,
+  epoch = Math.round(Date.now() / 1000.0)
+): string {
   const time = Math.floor(epoch / 30) + window;
   
   const hmac = crypto.createHmac('sha1', secret);
@@ -26,13 +29,23 @@ function generateTOTP(secret: string, window = 0): string {
 }
 
 function verifyTOTP(token: string, secret: string): boolean {
-  // Check current window and ±1 window for clock drift
+  if (typeof token !== 'string') return false;
+  const provided = Buffer.from(token);
+  
+  // Import the secret and read the clock once for all three windows
+  const key = crypto.createSecretKey(Buffer.from(secret));
+  const epoch = Math.round(Date.now() / 1000.0);
+  
+  // Check current window and ±1 window for clock drift. Every window is
+  // compared in constant time, without returning early on a match.
+  let matched = false;
   for (let window = -1; window <= 1; window++) {
-    if (generateTOTP(secret, window) === token) {
-      return true;
+    const expected = Buffer.from(generateTOTP(key, window, epoch));
+    if (expected.length === provided.length && crypto.timingSafeEqual(expected, provided)) {
+      matched = true;
     }
   }
-  return false;
+  return matched;
 }
 
 export async function POST(request: Request) {
@@ -182,11 +182,17 @@ export async function POST(request: NextRequest) {
     let updatedTokens = 0;
     let errors = 0;
 
+    // Start both list downloads up front so they overlap when refreshing from all sources
+    const jupiterListRequest = source === 'jupiter' || source === 'all' ? fetch(JUPITER_TOKEN_LIST_URL) : null;
+    const solanaListRequest = source === 'solana' || source === 'all' ? fetch(SOLANA_TOKEN_LIST_URL) : null;
+    // Mark as handled: it is only awaited after the Jupiter batch, which may throw first
+    solanaListRequest?.catch(() => {});
+
     try {
       // Fetch from Jupiter token list
-      if (source === 'jupiter' || source === 'all') {
+      if (jupiterListRequest) {
         console.log('📥 Fetching from Jupiter API...');
-        const response = await fetch(JUPITER_TOKEN_LIST_URL);
+        const response = await jupiterListRequest;
         
         if (!response.ok) {
           throw new Error(`Jupiter API error: ${response.status}`);
@@ -273,9 +279,9 @@ export async function POST(request: NextRequest) {
       }
 
       // Fetch from Solana token registry
-      if (source === 'solana' || source === 'all') {
+      if (solanaListRequest) {
         console.log('📥 Fetching from Solana token registry...');
-        const response = await fetch(SOLANA_TOKEN_LIST_URL);
+        const response = await solanaListRequest;
         
         if (response.ok) {
           const registry = await response.json();
@@ -1,5 +1,16 @@
 import { NextRequest, NextResponse } from 'next/server';
 
+// Environment is fixed for the lifetime of the process
+const ENVIRONMENT = process.env.NODE_ENV;
+
+// Response headers are identical for every ping
+const PING_HEADERS = {
+  // Set cache control to no-cache to ensure fresh status checks
+  'Cache-Control': 'no-cache, no-store, must-revalidate',
+  'Pragma': 'no-cache',
+  'Expires': '0'
+};
+
 /**
  * Simple ping endpoint for checking API connectivity
  * Used by the NetworkStatusHandler component to monitor connection quality
@@ -13,16 +24,11 @@ export async function GET(request: NextRequest) {
     { 
       status: 'ok', 
       timestamp: requestTime,
-      env: process.env.NODE_ENV
+      env: ENVIRONMENT
     },
     { 
       status: 200,
-      headers: {
-        // Set cache control to no-cache to ensure fresh status checks
-        'Cache-Control': 'no-cache, no-store, must-revalidate',
-        'Pragma': 'no-cache',
-        'Expires': '0'
-      }
+      headers: PING_HEADERS
     }
   );
 }
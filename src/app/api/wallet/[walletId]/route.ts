@@ -30,11 +30,26 @@ export async function GET(
   // const walletService = new RealBlockchainWalletService();
     // await walletService.updateWalletBalances(walletId);
     
-    const { data: wallet } = await supabaseServer
+    const { data: wallet, error } = await supabaseServer
       .from('wallets')
       .select('*')
       .eq('id', walletId)
-      .single() as { data: any };
+      .single() as { data: any; error: { code?: string; message: string } | null };
+    
+    // Handle query errors directly instead of throwing into the generic 500 handler
+    if (error) {
+      if (error.code === 'PGRST116') { // PGRST116 is "not found"
+        return NextResponse.json({ 
+          success: false, 
+          message: 'Wallet not found' 
+        }, { status: 404 });
+      }
+      console.error(`Error retrieving wallet ${walletId}:`, error.message);
+      return NextResponse.json({ 
+        success: false, 
+        message: 'Failed to retrieve wallet' 
+      }, { status: 500 });
+    }
     
     return NextResponse.json({ 
       success: true, 
@@ -240,8 +240,8 @@ export function useCurrencyConverter() {
   ): Promise<CurrencyConversion | null> => {
     // Check cache first
     const cacheKey = `${amount}-${from}-${to}-${includeFee}`;
-    if (useCache && conversionCache.has(cacheKey)) {
-      const cached = conversionCache.get(cacheKey)!;
+    const cached = useCache ? conversionCache.get(cacheKey) : undefined;
+    if (cached) {
       // Use cached result if it's less than 5 minutes old
       const cacheAge = Date.now() - new Date(cached.timestamp).getTime();
       if (cacheAge < 5 * 60 * 1000) { // 5 minutes
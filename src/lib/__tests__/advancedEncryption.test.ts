@@ -0,0 +1,51 @@
+import { encryptCardData, decryptCardData, type CardData } from '../advancedEncryption';
+
+const masterKey = 'test-master-key';
+
+const mockCard: CardData = {
+  cardNumber: '4111111111111111',
+  expiryDate: '12/30',
+  cvv: '123',
+  cardholderName: 'Test User',
+  billingAddress: {
+    street: '1 Test Street',
+    city: 'Oslo',
+    state: 'Oslo',
+    zip: '0150',
+    country: 'NO'
+  }
+};
+
+describe('AdvancedEncryption card data', () => {
+  it('should round-trip card data through encrypt and decrypt', async () => {
+    const encrypted = await encryptCardData(mockCard, masterKey, 'device-fingerprint');
+    const decrypted = await decryptCardData(encrypted, masterKey, 'device-fingerprint', '1111');
+
+    expect(decrypted).toEqual(mockCard);
+  });
+
+  it('should round-trip card data without optional fields', async () => {
+    const minimalCard: CardData = { ...mockCard };
+    delete minimalCard.billingAddress;
+    const encrypted = await encryptCardData(minimalCard, masterKey);
+    const decrypted = await decryptCardData(encrypted, masterKey, undefined, '1111');
+
+    expect(decrypted).toEqual(minimalCard);
+  });
+
+  it('should reject decryption with the wrong key', async () => {
+    const encrypted = await encryptCardData(mockCard, masterKey);
+
+    await expect(decryptCardData(encrypted, 'wrong-key', undefined, '1111')).rejects.toThrow(
+      'Failed to decrypt card data'
+    );
+  });
+
+  it('should reject decryption with the wrong last four digits', async () => {
+    const encrypted = await encryptCardData(mockCard, masterKey);
+
+    await expect(decryptCardData(encrypted, masterKey, undefined, '9999')).rejects.toThrow(
+      'Failed to decrypt card data'
+    );
+  });
+});
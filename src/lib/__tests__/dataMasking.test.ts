@@ -0,0 +1,33 @@
+import { maskCreditCard, maskPhone } from '../dataMasking';
+
+describe('maskCreditCard', () => {
+  it('should show only the last 4 digits', () => {
+    expect(maskCreditCard('4111111111111234')).toBe('••••••••••••1234');
+  });
+
+  it('should ignore separators', () => {
+    expect(maskCreditCard('4111 1111-1111 1234')).toBe('••••••••••••1234');
+  });
+
+  it('should fully mask values with fewer than 4 digits', () => {
+    expect(maskCreditCard('12a')).toBe('****');
+  });
+
+  it('should return an empty string for empty input', () => {
+    expect(maskCreditCard('')).toBe('');
+  });
+});
+
+describe('maskPhone', () => {
+  it('should show only the last 4 digits', () => {
+    expect(maskPhone('+1 (555) 123-4567')).toBe('•••••••4567');
+  });
+
+  it('should keep exactly 4 digits unmasked', () => {
+    expect(maskPhone('12-34')).toBe('1234');
+  });
+
+  it('should return an empty string for empty input', () => {
+    expect(maskPhone('')).toBe('');
+  });
+});
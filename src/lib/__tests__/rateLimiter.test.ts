@@ -0,0 +1,61 @@
+import { rateLimiter, checkRateLimit } from '../rateLimiter';
+
+// cardTransaction is a sliding window of 10 requests per minute
+const WINDOW_MS = 60 * 1000;
+const MAX_REQUESTS = 10;
+
+describe('AdvancedRateLimiter sliding window', () => {
+  const start = 1_700_000_000_000;
+  let now = start;
+
+  beforeEach(() => {
+    now = start;
+    jest.spyOn(Date, 'now').mockImplementation(() => now);
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  afterAll(() => {
+    rateLimiter.destroy();
+  });
+
+  it('should allow requests up to the limit and then reject', async () => {
+    for (let i = 0; i < MAX_REQUESTS; i++) {
+      expect((await checkRateLimit('cardTransaction', 'limit')).allowed).toBe(true);
+    }
+
+    const result = await checkRateLimit('cardTransaction', 'limit');
+    expect(result.allowed).toBe(false);
+    expect(result.remainingRequests).toBe(0);
+  });
+
+  it('should evict requests that fall out of the window', async () => {
+    for (let i = 0; i < 5; i++) {
+      await checkRateLimit('cardTransaction', 'evict');
+    }
+    now = start + WINDOW_MS / 2;
+    for (let i = 0; i < 5; i++) {
+      await checkRateLimit('cardTransaction', 'evict');
+    }
+
+    // Only the first five requests have expired
+    now = start + WINDOW_MS + 1;
+    const result = await checkRateLimit('cardTransaction', 'evict');
+    expect(result.allowed).toBe(true);
+    expect(result.remainingRequests).toBe(MAX_REQUESTS - 6);
+    expect(result.resetTime).toBe(start + WINDOW_MS / 2 + WINDOW_MS);
+  });
+
+  it('should evict requests exactly at the window boundary', async () => {
+    for (let i = 0; i < MAX_REQUESTS - 1; i++) {
+      await checkRateLimit('cardTransaction', 'boundary');
+    }
+
+    now = start + WINDOW_MS;
+    const result = await checkRateLimit('cardTransaction', 'boundary');
+    expect(result.allowed).toBe(true);
+    expect(result.remainingRequests).toBe(MAX_REQUESTS - 1);
+  });
+});
@@ -0,0 +1,43 @@
+import { isValidLuhn, creditCardSchema } from '../validation';
+
+describe('isValidLuhn', () => {
+  it('should accept valid even-length numbers', () => {
+    expect(isValidLuhn('4111111111111111')).toBe(true);
+    expect(isValidLuhn('4012888888881881')).toBe(true);
+    expect(isValidLuhn('18')).toBe(true);
+  });
+
+  it('should accept valid odd-length numbers', () => {
+    expect(isValidLuhn('378282246310005')).toBe(true);
+    expect(isValidLuhn('79927398713')).toBe(true);
+    expect(isValidLuhn('0')).toBe(true);
+  });
+
+  it('should reject numbers with a wrong check digit', () => {
+    expect(isValidLuhn('4111111111111112')).toBe(false);
+    expect(isValidLuhn('378282246310006')).toBe(false);
+    expect(isValidLuhn('79927398710')).toBe(false);
+  });
+
+  it('should reject non-digit input', () => {
+    expect(isValidLuhn('4111-1111-1111-1111')).toBe(false);
+    expect(isValidLuhn('4111 1111 1111 1111')).toBe(false);
+    expect(isValidLuhn('41111111111111a1')).toBe(false);
+    expect(isValidLuhn('4111111111111111\n')).toBe(false);
+    // ':' sits right after '9', so its offset (10) would otherwise sum to 0 mod 10
+    expect(isValidLuhn(':')).toBe(false);
+  });
+});
+
+describe('creditCardSchema', () => {
+  it('should accept formatted valid card numbers', () => {
+    expect(creditCardSchema.safeParse('4111 1111 1111 1111').success).toBe(true);
+    expect(creditCardSchema.safeParse('3782-822463-10005').success).toBe(true);
+  });
+
+  it('should reject invalid or wrongly sized card numbers', () => {
+    expect(creditCardSchema.safeParse('4111 1111 1111 1112').success).toBe(false);
+    expect(creditCardSchema.safeParse('79927398713').success).toBe(false);
+    expect(creditCardSchema.safeParse('').success).toBe(false);
+  });
+});
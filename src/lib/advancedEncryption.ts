@@ -8,10 +8,14 @@
  * - Backup codes and recovery data
  */
 
-import { randomBytes, createCipheriv, createDecipheriv, pbkdf2Sync, createHmac, scrypt } from 'crypto';
+import { randomBytes, createCipheriv, createDecipheriv, pbkdf2, pbkdf2Sync, createHmac, scrypt, timingSafeEqual } from 'crypto';
 import { promisify } from 'util';
 
 const scryptAsync = promisify(scrypt);
+const pbkdf2Async = promisify(pbkdf2);
+
+// Maximum number of memoized application keys (oldest evicted first)
+const APPLICATION_KEY_CACHE_SIZE = 256;
 
 // Encryption algorithms and configurations
 const ENCRYPTION_CONFIG = {
@@ -35,14 +39,15 @@ const ENCRYPTION_CONFIG = {
     tagLength: 16,
     saltLength: 32
   },
-  // For general user data
+  // For general user data (older aes-256-cbc records still decrypt, since
+  // decryption uses the algorithm stored with the record)
   GENERAL: {
-    algorithm: 'aes-256-cbc',
+    algorithm: 'aes-256-gcm',
     keyDerivation: 'pbkdf2' as const,
     iterations: 50000,
     keyLength: 32,
-    ivLength: 16,
-    tagLength: 0,
+    ivLength: 12,
+    tagLength: 16,
     saltLength: 16
   }
 };
@@ -84,6 +89,8 @@ export interface BiometricTemplate {
 class AdvancedEncryption {
   private static instance: AdvancedEncryption;
   private readonly version = '2.0.0';
+  // Derived application keys, keyed by an HMAC of (master key, salt)
+  private applicationKeyCache: Map<string, string> = new Map();
 
   private constructor() {}
 
@@ -110,6 +117,7 @@ class AdvancedEncryption {
 
   /**
    * Derive a key from a password using PBKDF2 or Scrypt
+   * Both run on the libuv thread pool so derivation never blocks the event loop
    */
   private async deriveKey(
     password: string,
@@ -119,7 +127,7 @@ class AdvancedEncryption {
     if (config.keyDerivation === 'scrypt') {
       return await scryptAsync(password, salt, config.keyLength) as Buffer;
     } else {
-      return pbkdf2Sync(password, salt, config.iterations, config.keyLength, 'sha512');
+      return await pbkdf2Async(password, salt, config.iterations, config.keyLength, 'sha512');
     }
   }
 
@@ -216,7 +224,7 @@ class AdvancedEncryption {
 
     // Combine master key with user fingerprint for additional security
     const password = userFingerprint ? `${masterKey}:${userFingerprint}` : masterKey;
-    const key = this.deriveKey(password, salt, config);
+    const key = await this.deriveKey(password, salt, config);
 
     // Serialize card data with timestamp and checksum
     const serializedData = JSON.stringify({
@@ -268,7 +276,7 @@ class AdvancedEncryption {
     // Derive the same key
     const password = userFingerprint ? `${masterKey}:${userFingerprint}` : masterKey;
     const config = ENCRYPTION_CONFIG.CARD_DATA;
-    const key = this.deriveKey(password, salt, config);
+    const key = await this.deriveKey(password, salt, config);
 
     // Create decipher
     const decipher = createDecipheriv(encryptedData.algorithm, key, iv);
@@ -290,7 +298,7 @@ class AdvancedEncryption {
       const { checksum, timestamp, ...cardData } = parsedData;
       const expectedChecksum = this.calculateChecksum(JSON.stringify(cardData));
       
-      if (checksum !== expectedChecksum) {
+      if (!this.hexDigestsEqual(checksum, expectedChecksum)) {
         throw new Error('Card data integrity check failed');
       }
 
@@ -312,7 +320,7 @@ class AdvancedEncryption {
     const iv = randomBytes(config.ivLength);
 
     // Derive encryption key
-    const key = this.deriveKey(password, salt, config);
+    const key = await this.deriveKey(password, salt, config);
 
     // Serialize data
     const plaintext = JSON.stringify({
@@ -321,17 +329,21 @@ class AdvancedEncryption {
       version: this.version
     });
 
-    // Create cipher
+    // Create cipher (AES-GCM: authenticated, and runs on AES-NI/CLMUL where available)
     const cipher = createCipheriv(config.algorithm, key, iv);
 
     // Encrypt data
     let encrypted = cipher.update(plaintext, 'utf8', 'base64');
     encrypted += cipher.final('base64');
 
+    // Get authentication tag
+    const tag = (cipher as any).getAuthTag();
+
     return {
       data: encrypted,
       salt: salt.toString('base64'),
       iv: iv.toString('base64'),
+      tag: tag.toString('base64'),
       algorithm: config.algorithm,
       iterations: config.iterations,
       keyDerivation: config.keyDerivation,
@@ -352,11 +364,16 @@ class AdvancedEncryption {
 
     // Derive the same key
     const config = ENCRYPTION_CONFIG.GENERAL;
-    const key = this.deriveKey(password, salt, config);
+    const key = await this.deriveKey(password, salt, config);
 
     // Create decipher
     const decipher = createDecipheriv(encryptedData.algorithm, key, iv);
 
+    // Set authentication tag for GCM mode
+    if (encryptedData.tag && encryptedData.algorithm.includes('gcm')) {
+      (decipher as any).setAuthTag(Buffer.from(encryptedData.tag, 'base64'));
+    }
+
     // Decrypt data
     let decrypted = decipher.update(encryptedData.data, 'base64', 'utf8');
     decrypted += decipher.final('utf8');
@@ -412,7 +429,7 @@ class AdvancedEncryption {
     
     // Verify MAC
     const expectedMac = this.calculateHMAC(template.template, combinedKey);
-    if (template.mac !== expectedMac) {
+    if (!this.hexDigestsEqual(template.mac, expectedMac)) {
       throw new Error('Biometric template integrity check failed');
     }
 
@@ -503,6 +520,18 @@ class AdvancedEncryption {
       .digest('hex');
   }
 
+  /**
+   * Constant-time comparison of a stored hex digest against a computed one
+   */
+  private hexDigestsEqual(provided: unknown, expected: string): boolean {
+    // Equal string lengths also rule out trailing non-hex characters, which Buffer.from drops
+    if (typeof provided !== 'string' || provided.length !== expected.length) return false;
+    const providedBytes = Buffer.from(provided, 'hex');
+    const expectedBytes = Buffer.from(expected, 'hex');
+    return providedBytes.length === expectedBytes.length &&
+      timingSafeEqual(providedBytes, expectedBytes);
+  }
+
   /**
    * Combine multiple keys securely
    */
@@ -522,7 +551,24 @@ class AdvancedEncryption {
     salt?: string
   ): string {
     const purposeSalt = salt || `${purpose}:${userId}:celora-v2`;
-    return pbkdf2Sync(masterKey, purposeSalt, 100000, 32, 'sha512').toString('hex');
+
+    // The derivation is deterministic, so reuse it instead of re-running
+    // 100k PBKDF2 rounds for every call with the same inputs
+    const cacheKey = createHmac('sha256', masterKey).update(purposeSalt).digest('base64');
+    const cached = this.applicationKeyCache.get(cacheKey);
+    if (cached) {
+      return cached;
+    }
+
+    const derived = pbkdf2Sync(masterKey, purposeSalt, 100000, 32, 'sha512').toString('hex');
+    if (this.applicationKeyCache.size >= APPLICATION_KEY_CACHE_SIZE) {
+      const oldest = this.applicationKeyCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.applicationKeyCache.delete(oldest);
+      }
+    }
+    this.applicationKeyCache.set(cacheKey, derived);
+    return derived;
   }
 
   /**
@@ -11,6 +11,7 @@
  */
 
 import { z } from 'zod';
+import { isValidLuhn } from './validation';
 
 // Card validation utilities
 const CARD_PATTERNS = {
@@ -31,6 +32,16 @@ const CRYPTO_PATTERNS = {
   ripple: /^r[0-9a-zA-Z]{24,34}$/
 };
 
+// Tags kept by sanitizeHTML when no allow-list is given
+const DEFAULT_ALLOWED_TAGS = ['p', 'br', 'strong', 'em', 'u', 'ol', 'ul', 'li'];
+
+// Matches any tag not in the given allow-list
+function buildDisallowedTagRegex(tags: string[]): RegExp {
+  return new RegExp(`<(?!\/?(?:${tags.join('|')})(?:\s|>))[^>]*>`, 'gi');
+}
+
+const DEFAULT_DISALLOWED_TAG_REGEX = buildDisallowedTagRegex(DEFAULT_ALLOWED_TAGS);
+
 export interface ValidationResult<T = any> {
   success: boolean;
   data?: T;
@@ -205,9 +216,6 @@ class AdvancedValidator {
    * Sanitize HTML content while preserving safe tags
    */
   sanitizeHTML(input: string, allowedTags?: string[]): string {
-    const defaultAllowedTags = ['p', 'br', 'strong', 'em', 'u', 'ol', 'ul', 'li'];
-    const tags = allowedTags || defaultAllowedTags;
-    
     // Simple HTML sanitization without external library
     let sanitized = input;
     
@@ -221,8 +229,7 @@ class AdvancedValidator {
       .replace(/javascript:/gi, ''); // Remove javascript: URLs
 
     // Remove all tags except allowed ones
-    const allowedTagsPattern = tags.join('|');
-    const tagRegex = new RegExp(`<(?!\/?(?:${allowedTagsPattern})(?:\s|>))[^>]*>`, 'gi');
+    const tagRegex = allowedTags ? buildDisallowedTagRegex(allowedTags) : DEFAULT_DISALLOWED_TAG_REGEX;
     sanitized = sanitized.replace(tagRegex, '');
 
     return sanitized.trim();
@@ -298,35 +305,23 @@ class AdvancedValidator {
     if (!isValidPattern) return false;
 
     // Luhn algorithm
-    let sum = 0;
-    let alternate = false;
-    
-    for (let i = digits.length - 1; i >= 0; i--) {
-      let n = parseInt(digits.charAt(i), 10);
-      
-      if (alternate) {
-        n *= 2;
-        if (n > 9) n = (n % 10) + 1;
-      }
-      
-      sum += n;
-      alternate = !alternate;
-    }
-    
-    return (sum % 10) === 0;
+    return isValidLuhn(digits);
   }
 
   /**
    * Validate card expiry date
    */
   private validateCardExpiry(expiry: string): boolean {
-    const [month, year] = expiry.split('/');
+    // Slice around the separator instead of allocating a split array
+    const separator = expiry.indexOf('/');
+    if (separator < 0) return false;
+    
     const currentDate = new Date();
     const currentMonth = currentDate.getMonth() + 1;
     const currentYear = currentDate.getFullYear() % 100;
     
-    const expiryMonth = parseInt(month, 10);
-    const expiryYear = parseInt(year, 10);
+    const expiryMonth = parseInt(expiry.slice(0, separator), 10);
+    const expiryYear = parseInt(expiry.slice(separator + 1), 10);
     
     if (expiryYear > currentYear) return true;
     if (expiryYear === currentYear && expiryMonth >= currentMonth) return true;
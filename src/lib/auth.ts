@@ -47,12 +47,37 @@ export interface MFAVerifyResponse {
   user?: User;
 }
 
+// Backoff schedule for the automatic sign-in that follows account creation.
+// The new user is usually visible within a few hundred milliseconds, so poll
+// early and back off instead of always waiting a fixed 2 seconds.
+const POST_SIGNUP_SIGNIN_INITIAL_DELAY_MS = 250;
+const POST_SIGNUP_SIGNIN_MAX_DELAY_MS = 2000;
+const POST_SIGNUP_SIGNIN_MAX_ATTEMPTS = 4;
+
 class AuthService {
   // Lazily resolve the singleton client to avoid initializing at import-time
   get supabase() {
     return getSupabaseClient();
   }
 
+  // Retry a post-signup sign in with exponential backoff until it succeeds,
+  // requires MFA, or the attempts run out
+  private async signInWithBackoff(signIn: () => Promise<AuthResponse>): Promise<AuthResponse> {
+    let delayMs = POST_SIGNUP_SIGNIN_INITIAL_DELAY_MS;
+    let result: AuthResponse = { user: null, error: 'Sign in not attempted', success: false };
+    
+    for (let attempt = 0; attempt < POST_SIGNUP_SIGNIN_MAX_ATTEMPTS; attempt++) {
+      await new Promise(resolve => setTimeout(resolve, delayMs));
+      result = await signIn();
+      if (result.success || result.requiresMFA) {
+        return result;
+      }
+      delayMs = Math.min(delayMs * 2, POST_SIGNUP_SIGNIN_MAX_DELAY_MS);
+    }
+    
+    return result;
+  }
+
   // Sign in with email and password - ENHANCED WITH CAPTCHA HANDLING & MFA
   async signInWithEmail(email: string, password: string): Promise<AuthResponse> {
     try {
@@ -545,11 +570,9 @@ class AuthService {
         if (backupResponse.ok && backupResult.success) {
           console.log('✅ Email account created via backup API successfully');
           
-          // Wait a moment for the user to be fully created, then sign in
-          console.log('⏳ Waiting before attempting sign in...');
-          await new Promise(resolve => setTimeout(resolve, 2000));
-          
-          const signInResult = await this.signInWithEmail(email, password);
+          // Sign in as soon as the user is fully created
+          console.log('⏳ Waiting for account before attempting sign in...');
+          const signInResult = await this.signInWithBackoff(() => this.signInWithEmail(email, password));
           console.log('🔑 Email sign in result:', signInResult);
           
           if (signInResult.success) {
@@ -634,12 +657,10 @@ class AuthService {
       if (backupResponse.ok && backupResult.success) {
         console.log('✅ Wallet created successfully via Admin API');
         
-        // Wait and then try to sign in
-        console.log('⏳ Waiting 2 seconds before sign in...');
-        await new Promise(resolve => setTimeout(resolve, 2000));
-        
-        // Try direct sign in (no captcha issues here since account exists)
-        const signInResult = await this.signInWithSeedPhrase(seedPhrase);
+        // Try direct sign in (no captcha issues here since account exists),
+        // backing off until the new account is visible
+        console.log('⏳ Waiting for wallet account before sign in...');
+        const signInResult = await this.signInWithBackoff(() => this.signInWithSeedPhrase(seedPhrase));
         
         if (signInResult.success) {
           console.log('🎉 Auto sign-in successful!');
@@ -109,23 +109,55 @@ export function generateCspNonce() {
   return Buffer.from(buffer).toString('base64');
 }
 
+/**
+ * Pre-joined CSP directives, rebuilt only when the config changes.
+ * The nonce is the only per-request part, so everything else is joined once.
+ */
+let cspDirectiveCache: { directives: string[]; scriptSrcIndex: number; header: string } | null = null;
+let additionalHeaderEntries: Array<[string, string]> | null = null;
+
+function getCspDirectives() {
+  if (!cspDirectiveCache) {
+    const keys = Object.keys(cspConfig)
+      .filter(key => key !== 'reportOnly' && key !== 'additionalHeaders');
+    const directives = keys.map(key => {
+      // @ts-ignore - Dynamic key access
+      return `${key} ${(cspConfig[key] as string[]).join(' ')}`;
+    });
+    cspDirectiveCache = {
+      directives,
+      scriptSrcIndex: keys.indexOf('script-src'),
+      header: directives.join('; ')
+    };
+  }
+  return cspDirectiveCache;
+}
+
+function getAdditionalHeaderEntries(): Array<[string, string]> {
+  if (!additionalHeaderEntries) {
+    additionalHeaderEntries = Object.entries(cspConfig.additionalHeaders) as Array<[string, string]>;
+  }
+  return additionalHeaderEntries;
+}
+
 /**
  * Builds the Content-Security-Policy header value
  */
 export function buildCspHeader(nonce?: string): string {
-  // Clone the config to avoid modifying the original
-  const config = JSON.parse(JSON.stringify(cspConfig));
+  const { directives, scriptSrcIndex, header } = getCspDirectives();
   
-  // Add nonce to script-src if provided
-  if (nonce) {
-    config['script-src'].push(`'nonce-${nonce}'`);
+  if (!nonce) {
+    return header;
   }
   
-  // Build the CSP header string
-  return Object.entries(config)
-    .filter(([key]) => key !== 'reportOnly' && key !== 'additionalHeaders')
-    .map(([key, values]) => `${key} ${(values as string[]).join(' ')}`)
-    .join('; ');
+  // Add nonce to script-src (or as a new script-src directive if none is configured)
+  const withNonce = directives.slice();
+  if (scriptSrcIndex === -1) {
+    withNonce.push(`script-src 'nonce-${nonce}'`);
+  } else {
+    withNonce[scriptSrcIndex] += ` 'nonce-${nonce}'`;
+  }
+  return withNonce.join('; ');
 }
 
 /**
@@ -141,9 +173,9 @@ export function addCspHeaders(res: NextResponse, nonce?: string): NextResponse {
   res.headers.set(headerName, cspValue);
   
   // Set additional security headers
-  Object.entries(cspConfig.additionalHeaders).forEach(([header, value]) => {
-    res.headers.set(header, value as string);
-  });
+  for (const [header, value] of getAdditionalHeaderEntries()) {
+    res.headers.set(header, value);
+  }
   
   return res;
 }
@@ -178,4 +210,8 @@ export function updateCspConfig(updates: Partial<typeof cspConfig>): void {
       cspConfig[key] = value;
     }
   });
+  
+  // Invalidate the pre-joined header strings
+  cspDirectiveCache = null;
+  additionalHeaderEntries = null;
 }
@@ -8,6 +8,7 @@
  */
 
 const CSRF_TOKEN_KEY = 'celora-csrf-token';
+const CSRF_COOKIE_PATTERN = new RegExp(`${CSRF_TOKEN_KEY}=([^;]+)`);
 const CSRF_HEADER = 'x-csrf-token';
 
 /**
@@ -81,8 +82,25 @@ export function validateCsrfToken(request: Request): boolean {
   // For this example, we'll assume we have a function to get the expected token
   const expectedToken = getExpectedCsrfToken(request);
   
-  // Simple equality check (in production, use timing-safe comparison)
-  return csrfToken === expectedToken;
+  if (!csrfToken || !expectedToken) return false;
+  
+  return constantTimeEqual(csrfToken, expectedToken);
+}
+
+/**
+ * Compare two strings without an early exit on the first mismatch.
+ * XOR-ORs every char code so the time taken does not depend on where the
+ * strings differ (this module also runs in the browser, so node:crypto's
+ * timingSafeEqual is not available here).
+ */
+function constantTimeEqual(a: string, b: string): boolean {
+  if (a.length !== b.length) return false;
+  
+  let diff = 0;
+  for (let i = 0; i < a.length; i++) {
+    diff |= a.charCodeAt(i) ^ b.charCodeAt(i);
+  }
+  return diff === 0;
 }
 
 /**
@@ -96,6 +114,6 @@ function getExpectedCsrfToken(request: Request): string | null {
   if (!cookies) return null;
   
   // Parse cookies and find the CSRF token cookie
-  const csrfCookieMatch = cookies.match(new RegExp(`${CSRF_TOKEN_KEY}=([^;]+)`));
+  const csrfCookieMatch = cookies.match(CSRF_COOKIE_PATTERN);
   return csrfCookieMatch ? csrfCookieMatch[1] : null;
 }
@@ -6,19 +6,43 @@
  */
 
 /**
- * Mask a credit card number, showing only the last 4 digits
+ * Mask all but the last 4 digits of a value, ignoring non-digit characters.
+ * Counts digits and captures the last four in a single pass instead of
+ * building an intermediate digits-only string.
  */
-export function maskCreditCard(cardNumber: string): string {
-  if (!cardNumber) return '';
-  
-  // Remove any non-digit characters
-  const digits = cardNumber.replace(/\D/g, '');
+function maskDigits(value: string): string {
+  let digitCount = 0;
+  let last4 = '';
+  
+  for (let i = 0; i < value.length; i++) {
+    const code = value.charCodeAt(i);
+    if (code >= 48 && code <= 57) { // '0'..'9'
+      digitCount++;
+    }
+  }
   
   // Check if we have enough digits to mask
-  if (digits.length < 4) return '****';
+  if (digitCount < 4) return '****';
+  
+  // Collect the last 4 digits walking back from the end
+  for (let i = value.length - 1; i >= 0 && last4.length < 4; i--) {
+    const code = value.charCodeAt(i);
+    if (code >= 48 && code <= 57) {
+      last4 = value[i] + last4;
+    }
+  }
   
   // Show only the last 4 digits
-  return '•'.repeat(digits.length - 4) + digits.slice(-4);
+  return '•'.repeat(digitCount - 4) + last4;
+}
+
+/**
+ * Mask a credit card number, showing only the last 4 digits
+ */
+export function maskCreditCard(cardNumber: string): string {
+  if (!cardNumber) return '';
+  
+  return maskDigits(cardNumber);
 }
 
 /**
@@ -41,14 +65,7 @@ export function maskEmail(email: string): string {
 export function maskPhone(phoneNumber: string): string {
   if (!phoneNumber) return '';
   
-  // Remove any non-digit characters
-  const digits = phoneNumber.replace(/\D/g, '');
-  
-  // Check if we have enough digits to mask
-  if (digits.length < 4) return '****';
-  
-  // Show only the last 4 digits
-  return '•'.repeat(digits.length - 4) + digits.slice(-4);
+  return maskDigits(phoneNumber);
 }
 
 /**
@@ -72,6 +89,34 @@ export function maskName(name: string): string {
   }
 }
 
+// Patterns for common PII, compiled once at module load. String.replace resets
+// lastIndex on global regexes, so sharing them across calls is safe
+const PII_PATTERNS: Array<{ pattern: RegExp; replace: (match: string) => string }> = [
+  // Credit card numbers (with or without spaces/dashes)
+  { pattern: /(\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4})/g, replace: (m: string) => maskCreditCard(m) },
+  
+  // Social Security Numbers (123-45-6789 format)
+  { pattern: /\b(\d{3}-\d{2}-\d{4})\b/g, replace: () => '***-**-****' },
+  
+  // Email addresses
+  { pattern: /\b([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})\b/g, replace: (m: string) => maskEmail(m) },
+  
+  // Phone numbers in various formats
+  { pattern: /\b(\+?\d{1,3}[\s-]?\(?\d{3}\)?[\s-]?\d{3}[\s-]?\d{4})\b/g, replace: (m: string) => maskPhone(m) },
+  
+  // IP addresses
+  { pattern: /\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b/g, replace: () => '*.*.*.*.* (redacted IP)' },
+  
+  // JWT tokens
+  { pattern: /(eyJ[A-Za-z0-9_-]{5,}\.eyJ[A-Za-z0-9_-]{5,})\.[A-Za-z0-9_-]+/g, replace: (m: string) => {
+    const parts = m.split('.');
+    return `${parts[0].substring(0, 10)}...${parts[1].substring(0, 10)}...redacted`;
+  }},
+  
+  // API keys and access tokens (assumed to be long alphanumeric strings with special chars)
+  { pattern: /\b([A-Za-z0-9+/]{30,}=*)\b/g, replace: (m: string) => `${m.substring(0, 6)}...${m.substring(m.length - 4)} (redacted key)` }
+];
+
 /**
  * Mask any PII (Personally Identifiable Information) in a text
  * This is useful for logs or error messages
@@ -79,36 +124,9 @@ export function maskName(name: string): string {
 export function maskPII(text: string): string {
   if (!text) return '';
   
-  // Define patterns for common PII
-  const patterns = [
-    // Credit card numbers (with or without spaces/dashes)
-    { pattern: /(\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4})/g, replace: (m: string) => maskCreditCard(m) },
-    
-    // Social Security Numbers (123-45-6789 format)
-    { pattern: /\b(\d{3}-\d{2}-\d{4})\b/g, replace: () => '***-**-****' },
-    
-    // Email addresses
-    { pattern: /\b([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})\b/g, replace: (m: string) => maskEmail(m) },
-    
-    // Phone numbers in various formats
-    { pattern: /\b(\+?\d{1,3}[\s-]?\(?\d{3}\)?[\s-]?\d{3}[\s-]?\d{4})\b/g, replace: (m: string) => maskPhone(m) },
-    
-    // IP addresses
-    { pattern: /\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b/g, replace: () => '*.*.*.*.* (redacted IP)' },
-    
-    // JWT tokens
-    { pattern: /(eyJ[A-Za-z0-9_-]{5,}\.eyJ[A-Za-z0-9_-]{5,})\.[A-Za-z0-9_-]+/g, replace: (m: string) => {
-      const parts = m.split('.');
-      return `${parts[0].substring(0, 10)}...${parts[1].substring(0, 10)}...redacted`;
-    }},
-    
-    // API keys and access tokens (assumed to be long alphanumeric strings with special chars)
-    { pattern: /\b([A-Za-z0-9+/]{30,}=*)\b/g, replace: (m: string) => `${m.substring(0, 6)}...${m.substring(m.length - 4)} (redacted key)` }
-  ];
-  
   // Apply each pattern
   let result = text;
-  patterns.forEach(({ pattern, replace }) => {
+  PII_PATTERNS.forEach(({ pattern, replace }) => {
     result = result.replace(pattern, replace);
   });
   
@@ -21,6 +21,10 @@ const ENCRYPTION_CONFIG = {
   pbkdf2Iterations: 100000, // PBKDF2 iterations (recommended minimum)
 };
 
+// Shared UTF-8 codecs; both are stateless for one-shot encode()/decode() calls
+const textEncoder = new TextEncoder();
+const textDecoder = new TextDecoder();
+
 interface EncryptedData {
   data: string;           // Base64 encoded encrypted data
   iv: string;            // Base64 encoded initialization vector
@@ -36,14 +40,21 @@ interface KeyPair {
 }
 
 class EncryptionManager {
-  private crypto: Crypto;
+  private cryptoApi: Crypto | null = null;
 
-  constructor() {
-    if (typeof window !== 'undefined' && window.crypto && window.crypto.subtle) {
-      this.crypto = window.crypto;
-    } else {
-      throw new Error('Web Crypto API not available');
+  /**
+   * Web Crypto API, resolved on first use rather than at construction so that
+   * importing this module (e.g. during server rendering) doesn't require it
+   */
+  private get crypto(): Crypto {
+    if (!this.cryptoApi) {
+      if (typeof window !== 'undefined' && window.crypto && window.crypto.subtle) {
+        this.cryptoApi = window.crypto;
+      } else {
+        throw new Error('Web Crypto API not available');
+      }
     }
+    return this.cryptoApi;
   }
 
   // =======================================================================
@@ -79,7 +90,7 @@ class EncryptionManager {
     // Import password as key material
     const keyMaterial = await this.crypto.subtle.importKey(
       'raw',
-      new TextEncoder().encode(password),
+      textEncoder.encode(password),
       'PBKDF2',
       false,
       ['deriveBits', 'deriveKey']
@@ -168,7 +179,7 @@ class EncryptionManager {
         tagLength: ENCRYPTION_CONFIG.tagLength * 8, // bits
       },
       key,
-      new TextEncoder().encode(data)
+      textEncoder.encode(data)
     );
 
     // Extract encrypted data and authentication tag
@@ -209,7 +220,7 @@ class EncryptionManager {
       combined
     );
 
-    return new TextDecoder().decode(decryptedBuffer);
+    return textDecoder.decode(decryptedBuffer);
   }
 
   /**
@@ -302,16 +313,24 @@ class EncryptionManager {
     encryptedHolderName: EncryptedData;
     cardFingerprint: string;
   }> {
-    // Encrypt each field separately for security
-    const encryptedNumber = await this.encrypt(cardData.number, key);
-    const encryptedExpiry = await this.encrypt(`${cardData.expiryMonth}/${cardData.expiryYear}`, key);
-    const encryptedCvv = await this.encrypt(cardData.cvv, key);
-    const encryptedHolderName = await this.encrypt(cardData.holderName, key);
-
-    // Create card fingerprint (non-reversible identifier)
-    const cardFingerprint = await this.calculateChecksum(
-      cardData.number.slice(-4) + cardData.expiryMonth + cardData.expiryYear
-    );
+    // Encrypt each field separately for security (each with its own IV). The
+    // fields are independent, so all operations are submitted to WebCrypto at once
+    const [
+      encryptedNumber,
+      encryptedExpiry,
+      encryptedCvv,
+      encryptedHolderName,
+      cardFingerprint,
+    ] = await Promise.all([
+      this.encrypt(cardData.number, key),
+      this.encrypt(`${cardData.expiryMonth}/${cardData.expiryYear}`, key),
+      this.encrypt(cardData.cvv, key),
+      this.encrypt(cardData.holderName, key),
+      // Create card fingerprint (non-reversible identifier)
+      this.calculateChecksum(
+        cardData.number.slice(-4) + cardData.expiryMonth + cardData.expiryYear
+      ),
+    ]);
 
     return {
       encryptedNumber,
@@ -348,7 +367,7 @@ class EncryptionManager {
    * Calculate SHA-256 checksum
    */
   private async calculateChecksum(data: string): Promise<string> {
-    const buffer = await this.crypto.subtle.digest('SHA-256', new TextEncoder().encode(data));
+    const buffer = await this.crypto.subtle.digest('SHA-256', textEncoder.encode(data));
     return this.arrayBufferToBase64(buffer);
   }
 
@@ -423,7 +442,7 @@ class EncryptionManager {
 
     const keyMaterial = await this.crypto.subtle.importKey(
       'raw',
-      new TextEncoder().encode(password),
+      textEncoder.encode(password),
       'PBKDF2',
       false,
       ['deriveBits']
@@ -127,8 +127,9 @@ class FeatureFlagManager {
     userContext?: UserContext
   ): boolean {
     // Check for local override first (useful for development)
-    if (this.localOverrides.has(flagName)) {
-      return this.localOverrides.get(flagName)!;
+    const override = this.localOverrides.get(flagName);
+    if (override !== undefined) {
+      return override;
     }
 
     const flag = this.flags.get(flagName);
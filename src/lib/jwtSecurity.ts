@@ -11,6 +11,9 @@ import { logSecurity } from './logger';
 import { getCorrelationId } from './logger';
 import { getKeyRotationManager, KeyType } from './keyRotation';
 
+// Expected token audience, read once at module load
+const SUPABASE_URL = process.env.NEXT_PUBLIC_SUPABASE_URL;
+
 // Interface for JWT payload
 interface JwtPayload {
   exp: number;
@@ -110,21 +113,35 @@ export function detectTokenMisuse(
     ip?: string;
     userAgent?: string;
   }
+): { detected: boolean; reason?: string; severity: 'low' | 'medium' | 'high' } {
+  const { payload } = validateJwt(token);
+  
+  if (!payload) {
+    return { 
+      detected: true, 
+      reason: 'Invalid token format',
+      severity: 'medium'
+    };
+  }
+  
+  return detectPayloadMisuse(payload, context);
+}
+
+/**
+ * Misuse checks on an already-decoded token payload
+ */
+function detectPayloadMisuse(
+  payload: JwtPayload,
+  context: { 
+    userFingerprint?: string;
+    ip?: string;
+    userAgent?: string;
+  }
 ): { detected: boolean; reason?: string; severity: 'low' | 'medium' | 'high' } {
   try {
-    const { payload } = validateJwt(token);
-    
-    if (!payload) {
-      return { 
-        detected: true, 
-        reason: 'Invalid token format',
-        severity: 'medium'
-      };
-    }
-    
     // Check if token was issued for a different audience
     if (payload.aud && 
-        payload.aud !== process.env.NEXT_PUBLIC_SUPABASE_URL &&
+        payload.aud !== SUPABASE_URL &&
         !Array.isArray(payload.aud)) {
       return { 
         detected: true, 
@@ -172,19 +189,30 @@ export async function revokeToken(
   token: string, 
   reason: string
 ): Promise<boolean> {
-  try {
-    const { payload } = validateJwt(token);
-    
-    if (!payload) {
-      logSecurity('Failed to revoke invalid token', {
-        correlationId: getCorrelationId(),
-        action: 'revoke_token',
-        componentName: 'JWT'
-      }, { reason });
-      
-      return false;
-    }
+  const { payload } = validateJwt(token);
+  
+  if (!payload) {
+    logSecurity('Failed to revoke invalid token', {
+      correlationId: getCorrelationId(),
+      action: 'revoke_token',
+      componentName: 'JWT'
+    }, { reason });
     
+    return false;
+  }
+  
+  return revokeDecodedToken(token, payload, reason);
+}
+
+/**
+ * Adds an already-decoded token to the revocation list
+ */
+async function revokeDecodedToken(
+  token: string,
+  payload: JwtPayload,
+  reason: string
+): Promise<boolean> {
+  try {
     // Store revoked token identifier in the database or cache
     // In this example we use the jti (JWT ID) claim if available,
     // otherwise we use a hash of the token
@@ -196,7 +224,7 @@ export async function revokeToken(
     // In a real app you might use Redis or a specialized service
     
     // Add revoked token to database
-    const supabase = createClient();
+    const supabase = getAdminClient();
     
     const { error } = await supabase
       .from('revoked_tokens')
@@ -241,18 +269,25 @@ export async function revokeToken(
  * Checks if a token has been revoked
  */
 export async function isTokenRevoked(token: string): Promise<boolean> {
+  const { payload } = validateJwt(token);
+  
+  if (!payload) {
+    return true; // Invalid tokens are considered revoked
+  }
+  
+  return isPayloadRevoked(token, payload);
+}
+
+/**
+ * Revocation-list lookup for an already-decoded token
+ */
+async function isPayloadRevoked(token: string, payload: JwtPayload): Promise<boolean> {
   try {
-    const { payload } = validateJwt(token);
-    
-    if (!payload) {
-      return true; // Invalid tokens are considered revoked
-    }
-    
     // Get token identifier
     const tokenId = payload.jti || createTokenHash(token);
     
     // Check revocation list
-    const supabase = createClient();
+    const supabase = getAdminClient();
     
     const { data, error } = await supabase
       .from('revoked_tokens')
@@ -311,17 +346,35 @@ function createTokenHash(token: string): string {
 /**
  * Creates a Supabase client for token operations
  */
-function createClient() {
+function createClient(options?: Record<string, any>) {
   // We would typically use the Supabase client here
   // For this example, we're using a placeholder
   const { createClient } = require('@supabase/supabase-js');
   
   return createClient(
     process.env.NEXT_PUBLIC_SUPABASE_URL!,
-    process.env.SUPABASE_SERVICE_ROLE_KEY! // Use service role key for admin operations
+    process.env.SUPABASE_SERVICE_ROLE_KEY!, // Use service role key for admin operations
+    options
   );
 }
 
+// Shared service-role client for revocation-list queries
+let adminClient: any = null;
+
+/**
+ * Returns a process-wide Supabase client for revocation-list reads and writes.
+ * It never holds a user session, so it is safe to share between requests;
+ * session-changing calls (refreshSession) must use a fresh createClient().
+ */
+function getAdminClient() {
+  if (!adminClient) {
+    adminClient = createClient({
+      auth: { persistSession: false, autoRefreshToken: false }
+    });
+  }
+  return adminClient;
+}
+
 /**
  * Handles secure refresh of JWT tokens
  */
@@ -334,8 +387,11 @@ export async function refreshJwtSecurely(
   }
 ): Promise<{ success: boolean; newToken?: string; error?: string }> {
   try {
-    // Check if refresh token is revoked
-    if (await isTokenRevoked(refreshToken)) {
+    // Decode and validate the refresh token once; every check below reuses the payload
+    const { payload } = validateJwt(refreshToken);
+    
+    // Check if refresh token is revoked (invalid tokens are considered revoked)
+    if (!payload || await isPayloadRevoked(refreshToken, payload)) {
       logSecurity('Attempted to use revoked refresh token', {
         correlationId: getCorrelationId(),
         action: 'refresh_token',
@@ -348,21 +404,11 @@ export async function refreshJwtSecurely(
       };
     }
     
-    // Validate refresh token
-    const { valid, payload } = validateJwt(refreshToken);
-    
-    if (!valid || !payload) {
-      return { 
-        success: false,
-        error: 'Invalid refresh token'
-      };
-    }
-    
     // Check for token misuse
-    const misuseCheck = detectTokenMisuse(refreshToken, context);
+    const misuseCheck = detectPayloadMisuse(payload, context);
     if (misuseCheck.detected) {
       // Revoke the token if misuse is detected
-      await revokeToken(refreshToken, `Suspected misuse: ${misuseCheck.reason}`);
+      await revokeDecodedToken(refreshToken, payload, `Suspected misuse: ${misuseCheck.reason}`);
       
       logSecurity('Token misuse detected during refresh', {
         correlationId: getCorrelationId(),
@@ -381,8 +427,11 @@ export async function refreshJwtSecurely(
       };
     }
     
-    // Perform the actual token refresh using Supabase
-    const supabase = createClient();
+    // Perform the actual token refresh using Supabase (fresh client: this
+    // call installs a user session on the client it runs on)
+    const supabase = createClient({
+      auth: { persistSession: false, autoRefreshToken: false }
+    });
     const { data, error } = await supabase.auth.refreshSession({
       refresh_token: refreshToken
     });
@@ -396,7 +445,7 @@ export async function refreshJwtSecurely(
     
     // Revoke the old refresh token for enhanced security
     // This prevents refresh token reuse
-    await revokeToken(refreshToken, 'Refreshed for new token');
+    await revokeDecodedToken(refreshToken, payload, 'Refreshed for new token');
     
     logSecurity('Token refreshed successfully', {
       correlationId: getCorrelationId(),
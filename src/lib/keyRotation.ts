@@ -9,7 +9,7 @@ import 'server-only';
  * window if a key is compromised.
  */
 
-import { createHash, randomBytes } from 'crypto';
+import { createCipheriv, createDecipheriv, createHash, createSecretKey, KeyObject, randomBytes } from 'crypto';
 import { getCorrelationId, logSecurity } from './logger';
 import { createClient } from '@supabase/supabase-js';
 
@@ -39,6 +39,9 @@ interface KeyMetadata {
   description: string;
 }
 
+// Maximum number of decrypted keys kept in memory (least recently used evicted first)
+const KEY_CACHE_MAX_ENTRIES = 256;
+
 /**
  * Generates a cryptographically secure random key
  */
@@ -59,6 +62,8 @@ export function createKeyFingerprint(key: string): string {
 export class KeyRotationManager {
   private supabaseAdmin: any;
   private keyCache: Map<string, { key: string, metadata: KeyMetadata }> = new Map();
+  // AES key derived from the master key; the master key is fixed for the process
+  private masterKey: KeyObject | null = null;
   
   constructor() {
     // Initialize Supabase admin client for key management
@@ -174,8 +179,8 @@ export class KeyRotationManager {
   public async getActiveKey(keyType: KeyType): Promise<{ keyId: string, key: string }> {
     // Check cache first
     const cacheKey = `active_${keyType}`;
-    if (this.keyCache.has(cacheKey)) {
-      const cached = this.keyCache.get(cacheKey)!;
+    const cached = this.getCachedKey(cacheKey);
+    if (cached) {
       return { keyId: cached.metadata.id, key: cached.key };
     }
     
@@ -203,7 +208,7 @@ export class KeyRotationManager {
     const key = this.decryptKey(keyData.encrypted_key);
     
     // Cache for future use
-    this.keyCache.set(cacheKey, {
+    this.setCachedKey(cacheKey, {
       key,
       metadata: {
         id: keyData.id,
@@ -224,8 +229,9 @@ export class KeyRotationManager {
    */
   public async getKey(keyId: string): Promise<{ key: string, metadata: KeyMetadata }> {
     // Check cache first
-    if (this.keyCache.has(keyId)) {
-      return this.keyCache.get(keyId)!;
+    const cached = this.getCachedKey(keyId);
+    if (cached) {
+      return cached;
     }
     
     // Get key from database
@@ -260,7 +266,7 @@ export class KeyRotationManager {
     };
     
     // Cache for future use
-    this.keyCache.set(keyId, { key, metadata });
+    this.setCachedKey(keyId, { key, metadata });
     
     return { key, metadata };
   }
@@ -353,6 +359,45 @@ export class KeyRotationManager {
     }
   }
   
+  /**
+   * Looks up a decrypted key, marking it as most recently used
+   */
+  private getCachedKey(cacheKey: string): { key: string, metadata: KeyMetadata } | undefined {
+    const entry = this.keyCache.get(cacheKey);
+    if (entry) {
+      // Map preserves insertion order, so re-inserting moves the entry to the end
+      this.keyCache.delete(cacheKey);
+      this.keyCache.set(cacheKey, entry);
+    }
+    return entry;
+  }
+  
+  /**
+   * Caches a decrypted key, evicting the least recently used entry when full
+   */
+  private setCachedKey(cacheKey: string, entry: { key: string, metadata: KeyMetadata }): void {
+    this.keyCache.delete(cacheKey);
+    if (this.keyCache.size >= KEY_CACHE_MAX_ENTRIES) {
+      const oldest = this.keyCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.keyCache.delete(oldest);
+      }
+    }
+    this.keyCache.set(cacheKey, entry);
+  }
+  
+  /**
+   * Returns the AES key derived from the SHA-256 digest of the master key,
+   * built once as a KeyObject instead of on every encrypt/decrypt
+   */
+  private getMasterKey(): KeyObject {
+    if (!this.masterKey) {
+      const masterKey = process.env.MASTER_ENCRYPTION_KEY || 'default-master-key-replace-in-production';
+      this.masterKey = createSecretKey(createHash('sha256').update(masterKey).digest());
+    }
+    return this.masterKey;
+  }
+  
   /**
    * Encrypts a key for secure storage
    * Uses a master key stored in environment variables or HSM
@@ -360,13 +405,10 @@ export class KeyRotationManager {
   private encryptKey(key: string): string {
     // In production, replace with proper encryption using HSM or KMS
     // This is a placeholder implementation
-    const crypto = require('crypto');
-    const masterKey = process.env.MASTER_ENCRYPTION_KEY || 'default-master-key-replace-in-production';
-    
-    const iv = crypto.randomBytes(16);
-    const cipher = crypto.createCipheriv(
+    const iv = randomBytes(16);
+    const cipher = createCipheriv(
       'aes-256-gcm',
-      crypto.createHash('sha256').update(masterKey).digest(),
+      this.getMasterKey(),
       iv
     );
     
@@ -384,16 +426,13 @@ export class KeyRotationManager {
   private decryptKey(encryptedKey: string): string {
     // In production, replace with proper decryption using HSM or KMS
     // This is a placeholder implementation
-    const crypto = require('crypto');
-    const masterKey = process.env.MASTER_ENCRYPTION_KEY || 'default-master-key-replace-in-production';
-    
     const [ivBase64, authTagBase64, encryptedData] = encryptedKey.split(':');
     
     const iv = Buffer.from(ivBase64, 'base64');
     const authTag = Buffer.from(authTagBase64, 'base64');
-    const decipher = crypto.createDecipheriv(
+    const decipher = createDecipheriv(
       'aes-256-gcm',
-      crypto.createHash('sha256').update(masterKey).digest(),
+      this.getMasterKey(),
       iv
     );
     
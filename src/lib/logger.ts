@@ -39,6 +39,15 @@ interface LogEntry {
   error?: any;
 }
 
+// Severity ordering used to filter by minimum level (fixed set, built once)
+const LEVEL_ORDER: Record<LogLevel, number> = {
+  [LogLevel.DEBUG]: 0,
+  [LogLevel.INFO]: 1,
+  [LogLevel.WARN]: 2,
+  [LogLevel.ERROR]: 3,
+  [LogLevel.SECURITY]: 4
+};
+
 // Global correlation ID (useful for tracking requests)
 let currentCorrelationId: string | null = null;
 
@@ -112,17 +121,8 @@ export function log(message: string, options: LogOptions = {}, data?: any, error
     additionalContext = {}
   } = options;
   
-  // Check if this log level should be output
-  const levelOrder = {
-    [LogLevel.DEBUG]: 0,
-    [LogLevel.INFO]: 1,
-    [LogLevel.WARN]: 2,
-    [LogLevel.ERROR]: 3,
-    [LogLevel.SECURITY]: 4
-  };
-  
   // Skip logging if the level is below the minimum (except SECURITY logs which are always logged if enabled)
-  if (level !== LogLevel.SECURITY && levelOrder[level] < levelOrder[minimumLogLevel]) {
+  if (level !== LogLevel.SECURITY && LEVEL_ORDER[level] < LEVEL_ORDER[minimumLogLevel]) {
     return;
   }
   
@@ -165,20 +165,23 @@ export function log(message: string, options: LogOptions = {}, data?: any, error
     };
   }
   
+  // Serialize once; the entry may be written more than once below
+  const serialized = JSON.stringify(logEntry);
+  
   // Output the log entry based on level
   switch (level) {
     case LogLevel.DEBUG:
-      console.debug(JSON.stringify(logEntry));
+      console.debug(serialized);
       break;
     case LogLevel.INFO:
-      console.info(JSON.stringify(logEntry));
+      console.info(serialized);
       break;
     case LogLevel.WARN:
-      console.warn(JSON.stringify(logEntry));
+      console.warn(serialized);
       break;
     case LogLevel.ERROR:
     case LogLevel.SECURITY:
-      console.error(JSON.stringify(logEntry));
+      console.error(serialized);
       break;
   }
   
@@ -186,7 +189,7 @@ export function log(message: string, options: LogOptions = {}, data?: any, error
   if (level === LogLevel.SECURITY) {
     // In a real implementation, we'd send this to a security monitoring system
     // For now, just add a distinctive console log
-    console.error('⚠️ SECURITY EVENT:', JSON.stringify(logEntry));
+    console.error('⚠️ SECURITY EVENT:', serialized);
   }
 }
 
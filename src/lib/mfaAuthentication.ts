@@ -120,13 +120,15 @@ export async function generateQrCode(uri: string): Promise<string> {
  * Generates recovery codes for backup access
  */
 export function generateRecoveryCodes(count = 10): string[] {
+  // One CSPRNG read and hex encode for the whole batch (6 bytes = 12 hex chars per code)
+  const hex = randomBytes(6 * count).toString('hex').toUpperCase();
   const codes: string[] = [];
   for (let i = 0; i < count; i++) {
     // Format: XXXX-XXXX-XXXX (12 alphanumeric characters in groups of 4)
-    const part1 = randomBytes(2).toString('hex').toUpperCase();
-    const part2 = randomBytes(2).toString('hex').toUpperCase();
-    const part3 = randomBytes(2).toString('hex').toUpperCase();
-    codes.push(`${part1}-${part2}-${part3}`);
+    const offset = i * 12;
+    codes.push(
+      `${hex.slice(offset, offset + 4)}-${hex.slice(offset + 4, offset + 8)}-${hex.slice(offset + 8, offset + 12)}`
+    );
   }
   return codes;
 }
@@ -63,10 +63,14 @@ export interface CurrencyPreferences {
 class MultiCurrencyManager {
   private static instance: MultiCurrencyManager;
   private currencies: Map<string, Currency> = new Map();
+  // Active currencies, overall and by type; rebuilt lazily after the currency set changes
+  private activeCurrencies: Currency[] | null = null;
+  private activeCurrenciesByType: Map<string, Currency[]> = new Map();
   private exchangeRates: Map<string, ExchangeRate> = new Map();
   private userPreferences: Map<string, CurrencyPreferences> = new Map();
   private updateInterval: NodeJS.Timeout | null = null;
   private initialized: boolean = false;
+  private initializing: Promise<void> | null = null;
 
   private constructor() {}
 
@@ -82,7 +86,18 @@ class MultiCurrencyManager {
    */
   async initialize(): Promise<void> {
     if (this.initialized) return;
+    
+    // Concurrent callers share one in-flight initialization so currencies,
+    // rates and the update interval are set up exactly once
+    if (!this.initializing) {
+      this.initializing = this.runInitialization().finally(() => {
+        this.initializing = null;
+      });
+    }
+    return this.initializing;
+  }
 
+  private async runInitialization(): Promise<void> {
     try {
       // Check if multi-currency is enabled
       await featureFlags.initialize();
@@ -112,9 +127,46 @@ class MultiCurrencyManager {
 
   /**
    * Get all supported currencies
+   * The returned array is shared between callers and must not be mutated.
    */
   getSupportedCurrencies(): Currency[] {
-    return Array.from(this.currencies.values()).filter(c => c.isActive);
+    if (!this.activeCurrencies) {
+      this.indexActiveCurrencies();
+    }
+    return this.activeCurrencies!;
+  }
+
+  /**
+   * Get supported currencies of a given type ('fiat' or 'crypto')
+   * The returned array is shared between callers and must not be mutated.
+   */
+  getSupportedCurrenciesByType(type: string): Currency[] {
+    if (!this.activeCurrencies) {
+      this.indexActiveCurrencies();
+    }
+    return this.activeCurrenciesByType.get(type) || [];
+  }
+
+  /**
+   * Build the active-currency indexes in a single pass
+   */
+  private indexActiveCurrencies(): void {
+    const active: Currency[] = [];
+    const byType = new Map<string, Currency[]>();
+    
+    for (const currency of this.currencies.values()) {
+      if (!currency.isActive) continue;
+      active.push(currency);
+      const group = byType.get(currency.type);
+      if (group) {
+        group.push(currency);
+      } else {
+        byType.set(currency.type, [currency]);
+      }
+    }
+    
+    this.activeCurrencies = active;
+    this.activeCurrenciesByType = byType;
   }
 
   /**
@@ -242,8 +294,9 @@ class MultiCurrencyManager {
   async getUserPreferences(userId: string): Promise<CurrencyPreferences | null> {
     try {
       // Check cache first
-      if (this.userPreferences.has(userId)) {
-        return this.userPreferences.get(userId)!;
+      const cachedPreferences = this.userPreferences.get(userId);
+      if (cachedPreferences) {
+        return cachedPreferences;
       }
 
       // Fetch from database
@@ -375,6 +428,7 @@ class MultiCurrencyManager {
       if (error) throw error;
 
       this.currencies.clear();
+      this.activeCurrencies = null;
       if (data) {
         data.forEach((currency: any) => {
           this.currencies.set(currency.code, {
@@ -472,6 +526,7 @@ class MultiCurrencyManager {
     defaultCurrencies.forEach(currency => {
       this.currencies.set(currency.code, currency);
     });
+    this.activeCurrencies = null;
   }
 
   /**
@@ -539,11 +539,10 @@ class NotificationManager {
       }
 
       // Update local cache if we have it
-      if (this.pendingNotifications.has(notificationId)) {
-        const notification = this.pendingNotifications.get(notificationId)!;
+      const notification = this.pendingNotifications.get(notificationId);
+      if (notification) {
         notification.read = true;
         notification.readAt = new Date().toISOString();
-        this.pendingNotifications.set(notificationId, notification);
       }
 
       return true;
@@ -353,7 +353,7 @@ class AdvancedRateLimiter {
     }
 
     // Remove requests outside the sliding window
-    data.requests = data.requests.filter((timestamp: number) => timestamp > windowStart);
+    this.evictExpired(data.requests, windowStart);
 
     // Check if request can be allowed
     if (data.requests.length < rule.maxRequests) {
@@ -362,7 +362,8 @@ class AdvancedRateLimiter {
       data.blockUntil = 0; // Reset block
       this.storage.set(key, data);
 
-      const oldestRequest = Math.min(...data.requests);
+      // Timestamps are appended in order, so the head is the oldest
+      const oldestRequest = data.requests[0];
       const resetTime = oldestRequest + rule.windowMs;
 
       return {
@@ -378,7 +379,8 @@ class AdvancedRateLimiter {
       }
       this.storage.set(key, data);
 
-      const oldestRequest = Math.min(...data.requests);
+      // Timestamps are appended in order, so the head is the oldest
+      const oldestRequest = data.requests[0];
       const resetTime = oldestRequest + rule.windowMs;
 
       return {
@@ -392,6 +394,20 @@ class AdvancedRateLimiter {
     }
   }
 
+  /**
+   * Drop timestamps at or before the cutoff from the head of an ascending list.
+   * Mutates in place so a burst does not reallocate the whole window per request.
+   */
+  private evictExpired(requests: number[], cutoff: number): void {
+    let expired = 0;
+    while (expired < requests.length && requests[expired] <= cutoff) {
+      expired++;
+    }
+    if (expired > 0) {
+      requests.splice(0, expired);
+    }
+  }
+
   /**
    * Fixed window algorithm implementation
    */
@@ -589,7 +605,7 @@ class AdvancedRateLimiter {
       if (data.requests && Array.isArray(data.requests)) {
         // Sliding window - remove if no recent requests
         const oldestValidTime = now - (24 * 60 * 60 * 1000); // 24 hours
-        data.requests = data.requests.filter((timestamp: number) => timestamp > oldestValidTime);
+        this.evictExpired(data.requests, oldestValidTime);
         
         if (data.requests.length === 0 && (!data.blockUntil || data.blockUntil < now)) {
           shouldDelete = true;
@@ -217,28 +217,30 @@ export const withCaching = (
 export const withLogging = (handler: RouteHandler) => {
   return async (context: RouteHandlerContext) => {
     const { req, params } = context;
-    const start = Date.now();
+    // Wall clock is read once for the log prefix; durations use the monotonic clock
+    const startedAt = Date.now();
+    const start = performance.now();
     const method = req.method;
     const url = req.url;
     
-    console.log(`[${new Date().toISOString()}] ${method} ${url} - Started`);
+    console.log(`[${new Date(startedAt).toISOString()}] ${method} ${url} - Started`);
     
     try {
       // Call the handler
       const response = await handler(context);
       
       // Log the completion
-      const duration = Date.now() - start;
+      const duration = Math.round(performance.now() - start);
       console.log(
-        `[${new Date().toISOString()}] ${method} ${url} - Completed in ${duration}ms with status ${response.status}`
+        `[${new Date(startedAt + duration).toISOString()}] ${method} ${url} - Completed in ${duration}ms with status ${response.status}`
       );
       
       return response;
     } catch (error) {
       // Log the error
-      const duration = Date.now() - start;
+      const duration = Math.round(performance.now() - start);
       console.error(
-        `[${new Date().toISOString()}] ${method} ${url} - Failed after ${duration}ms:`,
+        `[${new Date(startedAt + duration).toISOString()}] ${method} ${url} - Failed after ${duration}ms:`,
         error
       );
       
@@ -7,10 +7,10 @@ const supabase = supabaseServer as any;
 
 // Encryption utilities would normally be imported from a secure module
 // This is a simplified example - in a production environment, use a proper encryption library
-const encryptData = (data: any, key: string): string => {
+const encryptData = (serialized: Buffer, key: string): string => {
   // In a real implementation, this would use a secure encryption algorithm
   // For demonstration purposes only - NOT secure:
-  return Buffer.from(JSON.stringify(data)).toString('base64');
+  return serialized.toString('base64');
 };
 
 const decryptData = (encryptedData: string, key: string): any => {
@@ -73,17 +73,8 @@ export class WalletBackupService {
     const encryptionKey = configuredKey || 'default-key';
     
     try {
-      // Get all user wallets or specified wallets
-  let wallets: Wallet[];
-      if (options.walletIds && options.walletIds.length > 0) {
-        wallets = [];
-        for (const id of options.walletIds) {
-          const wallet = await WalletService.getWallet(id);
-          if (wallet) wallets.push(wallet);
-        }
-      } else {
-        wallets = await WalletService.getUserWallets(userId);
-      }
+      // Get all user wallets or specified wallets (full rows)
+      const wallets: Wallet[] = await WalletService.getWalletsForBackup(userId, options.walletIds);
       
       // Get transactions if requested
       let transactions: WalletTransaction[] = [];
@@ -117,11 +108,15 @@ export class WalletBackupService {
         }
       };
       
+      // Serialize once; both the encrypted payload and the checksum are derived from it
+      const serialized = Buffer.from(JSON.stringify(backupData));
+      
       // Encrypt the backup data
-      const encryptedData = encryptData(backupData, encryptionKey);
+      const encryptedData = encryptData(serialized, encryptionKey);
       
       // Calculate checksum (in a real implementation, use a secure hashing algorithm)
-      const checksum = Buffer.from(JSON.stringify(backupData)).toString('base64').slice(0, 32);
+      // The first 24 bytes encode to exactly the 32 base64 characters kept
+      const checksum = serialized.subarray(0, 24).toString('base64');
       
       // Create backup record
       const backupId = uuidv4();
@@ -214,7 +209,8 @@ export class WalletBackupService {
       // Filter wallets if specific IDs are requested
       let walletsToRestore = backupData.wallets;
       if (options.walletIds && options.walletIds.length > 0) {
-        walletsToRestore = walletsToRestore.filter(w => options.walletIds!.includes(w.id));
+        const requestedIds = new Set(options.walletIds);
+        walletsToRestore = walletsToRestore.filter(w => requestedIds.has(w.id));
       }
       
       // Start a transaction
@@ -228,14 +224,16 @@ export class WalletBackupService {
         let walletsRestored = 0;
         let transactionsRestored = 0;
         
+        // Look up which wallets already exist in one query if we're not overwriting
+        const existingWalletIds = options.overwriteExisting
+          ? new Set<string>()
+          : new Set((await WalletService.getWallets(walletsToRestore.map(w => w.id))).map(w => w.id));
+        
         for (const wallet of walletsToRestore) {
-          // Check if wallet exists if we're not overwriting
-          if (!options.overwriteExisting) {
-            const existingWallet = await WalletService.getWallet(wallet.id);
-            if (existingWallet) {
-              console.log(`Skipping existing wallet: ${wallet.id}`);
-              continue;
-            }
+          // Skip existing wallets if we're not overwriting
+          if (existingWalletIds.has(wallet.id)) {
+            console.log(`Skipping existing wallet: ${wallet.id}`);
+            continue;
           }
           
           // Insert or update the wallet
@@ -263,11 +261,13 @@ export class WalletBackupService {
         
         // Restore transactions if requested
         if (options.restoreTransactions && backupData.transactions) {
-          const walletIds = walletsToRestore.map(w => w.id);
+          // Index the selected wallets by id so each transaction is an O(1) lookup
+          const walletsById = new Map(walletsToRestore.map(w => [w.id, w]));
           
           for (const transaction of backupData.transactions) {
             // Only restore transactions for the selected wallets
-            if (!walletIds.includes(transaction.wallet_id)) {
+            const wallet = walletsById.get(transaction.wallet_id);
+            if (!wallet) {
               continue;
             }
             
@@ -276,7 +276,7 @@ export class WalletBackupService {
               .from('transactions')
               .insert({
                 id: (transaction as any).id,
-                user_id: (transaction as any).user_id ?? (walletsToRestore.find(w=>w.id===transaction.wallet_id)?.user_id),
+                user_id: (transaction as any).user_id ?? wallet.user_id,
                 wallet_id: (transaction as any).wallet_id,
                 transaction_type: (transaction as any).type ?? (transaction as any).transaction_type ?? 'transfer',
                 amount: (transaction as any).amount,
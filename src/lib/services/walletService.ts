@@ -4,6 +4,12 @@ import { v4 as uuidv4 } from 'uuid';
 // Type assertion for Supabase to handle custom tables
 const supabase = supabaseServer as any;
 
+// Columns mapped by the Wallet interface. The wallets table also carries key
+// material and several generated legacy columns that callers never read.
+const WALLET_COLUMNS = 'id, user_id, wallet_name, wallet_type, currency, balance, is_primary, is_active, created_at, updated_at';
+// Backups keep the whole row, including key material, network and derivation path
+const WALLET_BACKUP_COLUMNS = '*';
+
 export interface Wallet {
   id: string;
   user_id: string;
@@ -91,6 +97,29 @@ export interface TransactionHistoryResult {
   };
 }
 
+/**
+ * Map transaction params to a `transactions` row (id and timestamps are assigned by the database)
+ */
+function toTransactionRow(params: CreateTransactionParams) {
+  return {
+    wallet_id: params.walletId,
+    amount: params.amount,
+    currency: params.currency,
+    type: params.type,
+    status: 'pending',
+    description: params.description,
+    metadata: params.metadata,
+    reference_id: params.referenceId,
+    merchant_name: params.merchantName,
+    merchant_category: params.merchantCategory,
+    merchant_location: params.merchantLocation,
+    fee_amount: params.feeAmount,
+    fee_currency: params.feeCurrency,
+    source_wallet_id: params.sourceWalletId,
+    destination_wallet_id: params.destinationWalletId
+  };
+}
+
 /**
  * Service for wallet management operations
  */
@@ -99,11 +128,10 @@ export class WalletService {
    * Create a new wallet
    */
   static async createWallet(params: CreateWalletParams): Promise<Wallet> {
-    
+    // id and timestamps come from the column defaults (gen_random_uuid(), now())
     const { data, error } = await supabase
       .from('wallets')
       .insert({
-        id: uuidv4(),
         user_id: params.userId,
         wallet_name: params.name,
         wallet_type: params.type,
@@ -112,7 +140,7 @@ export class WalletService {
         is_primary: params.isPrimary || false,
         is_active: true,
       })
-      .select()
+      .select(WALLET_COLUMNS)
       .single();
     
     if (error) {
@@ -138,7 +166,7 @@ export class WalletService {
   static async getWallet(id: string): Promise<Wallet | null> {
     const { data, error } = await supabase
       .from('wallets')
-      .select('*')
+      .select(WALLET_COLUMNS)
       .eq('id', id)
       .single();
     
@@ -150,13 +178,41 @@ export class WalletService {
     return data as Wallet | null;
   }
   
+  /**
+   * Get several wallets by ID in a single query (missing IDs are skipped).
+   * Results keep the order of `ids`.
+   */
+  static async getWallets(ids: string[]): Promise<Wallet[]> {
+    if (ids.length === 0) {
+      return [];
+    }
+    
+    const { data, error } = await supabase
+      .from('wallets')
+      .select(WALLET_COLUMNS)
+      .in('id', Array.from(new Set(ids)));
+    
+    if (error) {
+      console.error('Error fetching wallets:', error);
+      throw new Error(`Failed to fetch wallets: ${error.message}`);
+    }
+    
+    const found = new Map<string, Wallet>();
+    for (const wallet of (data || []) as Wallet[]) {
+      found.set(wallet.id, wallet);
+    }
+    
+    return ids.filter(id => found.has(id)).map(id => found.get(id)!);
+  }
+
+  
   /**
    * Get all wallets for a user
    */
   static async getUserWallets(userId: string): Promise<Wallet[]> {
     const { data, error } = await supabase
       .from('wallets')
-      .select('*')
+      .select(WALLET_COLUMNS)
       .eq('user_id', userId);
     
     if (error) {
@@ -167,6 +223,34 @@ export class WalletService {
     return data as Wallet[];
   }
   
+  /**
+   * Get full wallet rows for a backup: the given wallets, or all of the user's wallets.
+   * Results keep the order of `walletIds` when given.
+   */
+  static async getWalletsForBackup(userId: string, walletIds?: string[]): Promise<Wallet[]> {
+    let query = supabase
+      .from('wallets')
+      .select(WALLET_BACKUP_COLUMNS);
+    query = walletIds && walletIds.length > 0
+      ? query.in('id', Array.from(new Set(walletIds)))
+      : query.eq('user_id', userId);
+    
+    const { data, error } = await query;
+    
+    if (error) {
+      console.error('Error fetching wallets for backup:', error);
+      throw new Error(`Failed to fetch wallets: ${error.message}`);
+    }
+    
+    const wallets = (data || []) as Wallet[];
+    if (!walletIds || walletIds.length === 0) {
+      return wallets;
+    }
+    
+    const found = new Map(wallets.map(wallet => [wallet.id, wallet]));
+    return walletIds.filter(id => found.has(id)).map(id => found.get(id)!);
+  }
+  
   /**
    * Update a wallet
    */
@@ -191,7 +275,7 @@ export class WalletService {
       .from('wallets')
       .update(mapped)
       .eq('id', id)
-      .select()
+      .select(WALLET_COLUMNS)
       .single();
     
     if (error) {
@@ -222,7 +306,7 @@ export class WalletService {
     // Fetch wallet
     const { data: wallet, error: werr } = await supabase
       .from('wallets')
-      .select('*')
+      .select(WALLET_COLUMNS)
       .eq('id', id)
       .single();
     if (werr || !wallet) {
@@ -256,7 +340,7 @@ export class WalletService {
     // Fetch wallet to get user_id
     const { data: wallet, error: werr } = await supabase
       .from('wallets')
-      .select('*')
+      .select('user_id')
       .eq('id', walletId)
       .single();
     if (werr || !wallet) {
@@ -284,7 +368,7 @@ export class WalletService {
     // Return latest wallet state
     const { data: updated, error: uerr } = await supabase
       .from('wallets')
-      .select('*')
+      .select(WALLET_COLUMNS)
       .eq('id', walletId)
       .single();
     if (uerr) throw new Error(`Failed to fetch updated wallet: ${uerr.message}`);
@@ -296,30 +380,9 @@ export class WalletService {
    * Create a transaction
    */
   static async createTransaction(params: CreateTransactionParams): Promise<WalletTransaction> {
-    
-    // Format transaction data
-    const transactionData = {
-      id: uuidv4(),
-      wallet_id: params.walletId,
-      amount: params.amount,
-      currency: params.currency,
-      type: params.type,
-      status: 'pending',
-      description: params.description,
-      metadata: params.metadata,
-      reference_id: params.referenceId,
-      merchant_name: params.merchantName,
-      merchant_category: params.merchantCategory,
-      merchant_location: params.merchantLocation,
-      fee_amount: params.feeAmount,
-      fee_currency: params.feeCurrency,
-      source_wallet_id: params.sourceWalletId,
-      destination_wallet_id: params.destinationWalletId
-    };
-    
     const { data, error } = await supabase
       .from('transactions')
-      .insert(transactionData)
+      .insert(toTransactionRow(params))
       .select()
       .single();
     
@@ -424,74 +487,95 @@ export class WalletService {
     currency: string,
     description?: string
   ): Promise<{ sourceTransaction: WalletTransaction; destinationTransaction: WalletTransaction }> {
-    // Start a transaction
+    // Withdrawal from source wallet and deposit to destination wallet
+    const sourceParams: CreateTransactionParams = {
+      walletId: sourceWalletId,
+      amount: -amount, // Negative for withdrawal
+      currency,
+      type: 'transfer',
+      description: description || 'Transfer to another wallet',
+      destinationWalletId
+    };
+    const destinationParams: CreateTransactionParams = {
+      walletId: destinationWalletId,
+      amount, // Positive for deposit
+      currency,
+      type: 'transfer',
+      description: description || 'Transfer from another wallet',
+      sourceWalletId
+    };
+    
+    // Both ids are generated here so each leg can be written already linked to
+    // the other and completed. The single multi-row INSERT ... RETURNING is one
+    // statement, so either both final rows exist or neither does.
+    const sourceId = uuidv4();
+    const destinationId = uuidv4();
+    const { data: legs, error: insertError } = await supabase
+      .from('transactions')
+      .insert([
+        {
+          ...toTransactionRow(sourceParams),
+          id: sourceId,
+          related_transaction_id: destinationId,
+          status: 'completed'
+        },
+        {
+          ...toTransactionRow(destinationParams),
+          id: destinationId,
+          related_transaction_id: sourceId,
+          status: 'completed'
+        }
+      ])
+      .select();
+    
+    // Returned row order is not guaranteed, so pick each leg out by its id
+    const sourceTransaction = (legs as WalletTransaction[] | null)?.find(leg => leg.id === sourceId);
+    const destinationTransaction = (legs as WalletTransaction[] | null)?.find(leg => leg.id === destinationId);
+    
+    if (insertError || !sourceTransaction || !destinationTransaction) {
+      const error = new Error(`Failed to create transaction: ${insertError?.message || 'transfer legs not returned'}`);
+      // Nothing was written, so the server-side atomic function can safely take over
+      return WalletService.transferViaRpc(sourceWalletId, destinationWalletId, amount, currency, description, error);
+    }
+    
+    return { sourceTransaction, destinationTransaction };
+  }
+  
+  /**
+   * Fallback transfer through the server-side atomic `wallet_transfer` function.
+   * Only used when no transfer legs were written; rethrows `originalError` if it fails.
+   */
+  private static async transferViaRpc(
+    sourceWalletId: string,
+    destinationWalletId: string,
+    amount: number,
+    currency: string,
+    description: string | undefined,
+    originalError: Error
+  ): Promise<{ sourceTransaction: WalletTransaction; destinationTransaction: WalletTransaction }> {
     try {
-      // Create withdrawal from source wallet
-      const sourceParams: CreateTransactionParams = {
-        walletId: sourceWalletId,
-        amount: -amount, // Negative for withdrawal
-        currency,
-        type: 'transfer',
-        description: description || 'Transfer to another wallet',
-        destinationWalletId
-      };
-      
-      const sourceTransaction = await this.createTransaction(sourceParams);
-      
-      // Create deposit to destination wallet
-      const destinationParams: CreateTransactionParams = {
-        walletId: destinationWalletId,
-        amount, // Positive for deposit
-        currency,
-        type: 'transfer',
-        description: description || 'Transfer from another wallet',
-        sourceWalletId,
-        related_transaction_id: sourceTransaction.id
-      };
-      
-      const destinationTransaction = await this.createTransaction(destinationParams);
-      
-      // Update the source transaction with the related transaction ID
-      await supabase
-        .from('transactions')
-        .update({ related_transaction_id: destinationTransaction.id })
-        .eq('id', sourceTransaction.id);
-      
-      // Complete both transactions
-      await this.completeTransaction(sourceTransaction.id);
-      await this.completeTransaction(destinationTransaction.id);
-      
-      
-      return {
-        sourceTransaction,
-        destinationTransaction
-      };
-    } catch (error) {
-      // Try server-side atomic function if available
-      try {
-        const { data, error: rpcErr } = await supabase.rpc('wallet_transfer', {
-          p_source_wallet: sourceWalletId,
-          p_destination_wallet: destinationWalletId,
-          p_user_id: null, // provide when available in calling context
-          p_amount: amount,
-          p_currency: currency,
-          p_description: description || null
-        });
-        if (rpcErr) throw rpcErr;
-        // If RPC succeeded, fetch the created transactions
-        const srcId = data?.[0]?.source_tx;
-        const dstId = data?.[0]?.destination_tx;
-        if (srcId && dstId) {
-          const { data: src } = await supabase.from('transactions').select('*').eq('id', srcId).single();
-          const { data: dst } = await supabase.from('transactions').select('*').eq('id', dstId).single();
-          if (src && dst) {
-            return { sourceTransaction: src as WalletTransaction, destinationTransaction: dst as WalletTransaction };
-          }
+      const { data, error: rpcErr } = await supabase.rpc('wallet_transfer', {
+        p_source_wallet: sourceWalletId,
+        p_destination_wallet: destinationWalletId,
+        p_user_id: null, // provide when available in calling context
+        p_amount: amount,
+        p_currency: currency,
+        p_description: description || null
+      });
+      if (rpcErr) throw rpcErr;
+      // If RPC succeeded, fetch the created transactions
+      const srcId = data?.[0]?.source_tx;
+      const dstId = data?.[0]?.destination_tx;
+      if (srcId && dstId) {
+        const { data: src } = await supabase.from('transactions').select('*').eq('id', srcId).single();
+        const { data: dst } = await supabase.from('transactions').select('*').eq('id', dstId).single();
+        if (src && dst) {
+          return { sourceTransaction: src as WalletTransaction, destinationTransaction: dst as WalletTransaction };
         }
-        throw error;
-      } catch (fallbackErr) {
-        throw error;
       }
+    } catch (fallbackErr) {
+      // Report the original failure below
     }
+    throw originalError;
   }
 }
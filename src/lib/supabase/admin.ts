@@ -0,0 +1,35 @@
+// ================================================================
+// SUPABASE ADMIN CLIENT
+// Purpose: Shared untyped service-role client for API routes
+// Security: Uses service role key; server-side only
+// Usage: Import getSupabaseAdmin() in API routes that query tables
+//        missing from the generated Database types
+// ================================================================
+
+import { createClient, type SupabaseClient } from '@supabase/supabase-js'
+import { getSupabaseConfig } from '../supabase-config'
+
+let supabaseAdminClient: SupabaseClient | null = null
+
+/**
+ * Get the process-wide service-role Supabase client
+ *
+ * The client never holds a user session, so it is safe to share between
+ * requests; reusing it keeps HTTP connections alive instead of building a
+ * new client per request. It is created on first use.
+ *
+ * IMPORTANT: This client bypasses RLS policies. Callers must check
+ * ownership themselves before reading or writing user data.
+ */
+export function getSupabaseAdmin(): SupabaseClient {
+  if (!supabaseAdminClient) {
+    const { supabaseUrl, supabaseServiceKey } = getSupabaseConfig()
+    supabaseAdminClient = createClient(supabaseUrl, supabaseServiceKey, {
+      auth: {
+        autoRefreshToken: false,
+        persistSession: false
+      }
+    })
+  }
+  return supabaseAdminClient
+}
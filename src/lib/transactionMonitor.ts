@@ -11,6 +11,36 @@
  * - Network analysis for money laundering detection
  */
 
+// Alerts are dispatched asynchronously in batches of this size
+const ALERT_BATCH_SIZE = 32;
+// Upper bound on queued alerts awaiting dispatch
+const MAX_PENDING_ALERTS = 10000;
+
+// Maximum number of compiled rule patterns kept in memory (least recently used evicted first)
+const RULE_PATTERN_CACHE_MAX_ENTRIES = 256;
+
+// Compiled `regex` rule patterns, keyed by source. Rules are evaluated for
+// every transaction, so each pattern is compiled once rather than per check.
+const compiledRulePatterns = new Map<string, RegExp>();
+
+function compileRulePattern(source: string): RegExp {
+  let pattern = compiledRulePatterns.get(source);
+  if (pattern) {
+    // Map preserves insertion order, so re-inserting moves the entry to the end
+    compiledRulePatterns.delete(source);
+  } else {
+    pattern = new RegExp(source);
+    if (compiledRulePatterns.size >= RULE_PATTERN_CACHE_MAX_ENTRIES) {
+      const oldest = compiledRulePatterns.keys().next().value;
+      if (oldest !== undefined) {
+        compiledRulePatterns.delete(oldest);
+      }
+    }
+  }
+  compiledRulePatterns.set(source, pattern);
+  return pattern;
+}
+
 export interface Transaction {
   id: string;
   userId: string;
@@ -183,6 +213,7 @@ export interface TimePattern {
   activeDays: number[]; // Days of week
   timezone: string;
   nightTimeActivity: number; // Percentage
+  nightTransactionCount?: number; // Transactions between 23:00 and 05:59
 }
 
 export interface VelocityMetrics {
@@ -240,7 +271,14 @@ class TransactionMonitor {
   private static instance: TransactionMonitor;
   private userProfiles: Map<string, UserBehaviorProfile> = new Map();
   private transactions: Map<string, Transaction> = new Map();
+  // Transaction IDs per user, in insertion order, so per-user queries skip other users
+  private transactionIdsByUser: Map<string, Set<string>> = new Map();
   private suspiciousReports: Map<string, SuspiciousActivityReport> = new Map();
+  // Ring buffer of alerts awaiting dispatch; the oldest sits at pendingAlertHead
+  private pendingAlerts: Array<Record<string, any> | undefined> = new Array(MAX_PENDING_ALERTS);
+  private pendingAlertHead = 0;
+  private pendingAlertCount = 0;
+  private alertFlushScheduled = false;
   private activeMonitoringRules: MonitoringRule[] = [];
 
   // Default monitoring rules
@@ -376,10 +414,11 @@ class TransactionMonitor {
    * Monitor a transaction in real-time
    */
   async monitorTransaction(transaction: Transaction): Promise<MonitoringResult> {
-    const startTime = Date.now();
+    // Monotonic clock: durations are unaffected by system clock adjustments
+    const startTime = performance.now();
     
     // Get or create user behavior profile
-    const userProfile = await this.getUserBehaviorProfile(transaction.userId);
+    const userProfile = this.getUserBehaviorProfile(transaction.userId);
     
     // Initialize monitoring result
     const result: MonitoringResult = {
@@ -398,7 +437,7 @@ class TransactionMonitor {
     for (const rule of this.activeMonitoringRules) {
       if (!rule.enabled) continue;
 
-      const ruleResult = await this.evaluateRule(rule, transaction, userProfile);
+      const ruleResult = this.evaluateRule(rule, transaction, userProfile);
       
       if (ruleResult.triggered) {
         result.rulesTriggered.push(rule.id);
@@ -413,12 +452,12 @@ class TransactionMonitor {
         });
 
         // Execute rule actions
-        await this.executeRuleActions(rule, transaction, ruleResult);
+        this.executeRuleActions(rule, transaction, ruleResult);
       }
     }
 
     // Apply ML-based scoring (simulate for now)
-    result.mlScore = await this.calculateMLRiskScore(transaction, userProfile);
+    result.mlScore = this.calculateMLRiskScore(transaction, userProfile);
     result.riskScore += result.mlScore * 0.3; // Weight ML score at 30%
 
     // Determine final decision
@@ -427,12 +466,12 @@ class TransactionMonitor {
     // Calculate confidence based on data quality and rule certainty
     result.confidence = this.calculateConfidence(result, userProfile);
 
-    result.processingTime = Date.now() - startTime;
+    result.processingTime = performance.now() - startTime;
 
     // Store monitoring result
     transaction.monitoringResult = result;
     transaction.riskScore = result.riskScore;
-    this.transactions.set(transaction.id, transaction);
+    this.storeTransaction(transaction);
 
     // Log high-risk transactions
     if (result.riskScore > 70) {
@@ -456,11 +495,11 @@ class TransactionMonitor {
   /**
    * Get or create user behavior profile
    */
-  private async getUserBehaviorProfile(userId: string): Promise<UserBehaviorProfile> {
+  private getUserBehaviorProfile(userId: string): UserBehaviorProfile {
     let profile = this.userProfiles.get(userId);
     
     if (!profile) {
-      profile = await this.createInitialUserProfile(userId);
+      profile = this.createInitialUserProfile(userId);
       this.userProfiles.set(userId, profile);
     }
     
@@ -470,7 +509,7 @@ class TransactionMonitor {
   /**
    * Create initial user behavior profile
    */
-  private async createInitialUserProfile(userId: string): Promise<UserBehaviorProfile> {
+  private createInitialUserProfile(userId: string): UserBehaviorProfile {
     const now = Date.now();
     
     return {
@@ -501,7 +540,8 @@ class TransactionMonitor {
           activeHours: [],
           activeDays: [],
           timezone: 'UTC',
-          nightTimeActivity: 0
+          nightTimeActivity: 0,
+          nightTransactionCount: 0
         },
         preferredChannels: [],
         typicalCounterparties: []
@@ -640,11 +680,17 @@ class TransactionMonitor {
       patterns.activeDays.push(dayOfWeek);
     }
     
-    // Calculate night time activity percentage
+    // Calculate night time activity percentage from a counter kept on the profile
+    // rather than back-deriving the count from the previous percentage. Profiles
+    // created before the counter existed seed it once from that percentage
+    // (totalTransactions already includes this transaction).
+    let nightTransactions = patterns.nightTransactionCount ??
+      Math.round((patterns.nightTimeActivity / 100) * (profile.statistics.totalTransactions - 1));
     if (hour >= 23 || hour <= 5) {
-      const nightTransactions = profile.statistics.totalTransactions * (patterns.nightTimeActivity / 100) + 1;
-      patterns.nightTimeActivity = (nightTransactions / profile.statistics.totalTransactions) * 100;
+      nightTransactions++;
     }
+    patterns.nightTransactionCount = nightTransactions;
+    patterns.nightTimeActivity = (nightTransactions / profile.statistics.totalTransactions) * 100;
   }
 
   /**
@@ -664,14 +710,14 @@ class TransactionMonitor {
   /**
    * Evaluate monitoring rule against transaction
    */
-  private async evaluateRule(
+  private evaluateRule(
     rule: MonitoringRule, 
     transaction: Transaction, 
     userProfile: UserBehaviorProfile
-  ): Promise<{ triggered: boolean; details?: any }> {
+  ): { triggered: boolean; details?: any } {
     
     for (const condition of rule.conditions) {
-      const conditionMet = await this.evaluateCondition(condition, transaction, userProfile);
+      const conditionMet = this.evaluateCondition(condition, transaction, userProfile);
       
       if (!conditionMet) {
         return { triggered: false };
@@ -684,11 +730,11 @@ class TransactionMonitor {
   /**
    * Evaluate individual rule condition
    */
-  private async evaluateCondition(
+  private evaluateCondition(
     condition: RuleCondition,
     transaction: Transaction,
     userProfile: UserBehaviorProfile
-  ): Promise<boolean> {
+  ): boolean {
     
     switch (condition.type) {
       case 'amount':
@@ -725,7 +771,7 @@ class TransactionMonitor {
       case '!=':
         return amount !== condition.value;
       case 'regex':
-        return new RegExp(condition.value).test(amount.toString());
+        return compileRulePattern(condition.value).test(amount.toString());
       default:
         return false;
     }
@@ -819,16 +865,16 @@ class TransactionMonitor {
   /**
    * Execute rule actions
    */
-  private async executeRuleActions(
+  private executeRuleActions(
     rule: MonitoringRule,
     transaction: Transaction,
     ruleResult: { triggered: boolean; details?: any }
-  ): Promise<void> {
+  ): void {
     
     for (const action of rule.actions) {
       switch (action.type) {
         case 'flag':
-          await this.flagTransaction(transaction, rule, action.parameters);
+          this.flagTransaction(transaction, rule, action.parameters);
           break;
         
         case 'block':
@@ -840,7 +886,7 @@ class TransactionMonitor {
           break;
         
         case 'alert':
-          await this.sendAlert(transaction, rule);
+          this.sendAlert(transaction, rule);
           break;
         
         case 'log':
@@ -857,11 +903,11 @@ class TransactionMonitor {
   /**
    * Flag transaction
    */
-  private async flagTransaction(
+  private flagTransaction(
     transaction: Transaction,
     rule: MonitoringRule,
     parameters?: Record<string, any>
-  ): Promise<void> {
+  ): void {
     if (!transaction.flags) {
       transaction.flags = [];
     }
@@ -882,24 +928,60 @@ class TransactionMonitor {
   /**
    * Send alert for high-risk transaction
    */
-  private async sendAlert(transaction: Transaction, rule: MonitoringRule): Promise<void> {
-    // In production, send to monitoring dashboard, email, Slack, etc.
-    console.warn(`TRANSACTION ALERT: ${rule.name}`, {
+  private sendAlert(transaction: Transaction, rule: MonitoringRule): void {
+    // Queue the alert and dispatch it off the monitoring path
+    const alert = {
+      name: rule.name,
       transactionId: transaction.id,
       userId: transaction.userId,
       amount: transaction.amount,
       rule: rule.id,
       timestamp: new Date(transaction.timestamp).toISOString()
-    });
+    };
+    
+    if (this.pendingAlertCount === MAX_PENDING_ALERTS) {
+      // Full: overwrite the oldest rather than grow unbounded
+      this.pendingAlerts[this.pendingAlertHead] = alert;
+      this.pendingAlertHead = (this.pendingAlertHead + 1) % MAX_PENDING_ALERTS;
+    } else {
+      this.pendingAlerts[(this.pendingAlertHead + this.pendingAlertCount) % MAX_PENDING_ALERTS] = alert;
+      this.pendingAlertCount++;
+    }
+    
+    if (!this.alertFlushScheduled) {
+      this.alertFlushScheduled = true;
+      setTimeout(() => this.flushAlerts(), 0);
+    }
+  }
+
+  /**
+   * Dispatch queued alerts in batches
+   */
+  private flushAlerts(): void {
+    this.alertFlushScheduled = false;
+    
+    while (this.pendingAlertCount > 0) {
+      const batchSize = Math.min(ALERT_BATCH_SIZE, this.pendingAlertCount);
+      const batch: Array<Record<string, any>> = new Array(batchSize);
+      for (let i = 0; i < batchSize; i++) {
+        batch[i] = this.pendingAlerts[this.pendingAlertHead]!;
+        this.pendingAlerts[this.pendingAlertHead] = undefined;
+        this.pendingAlertHead = (this.pendingAlertHead + 1) % MAX_PENDING_ALERTS;
+      }
+      this.pendingAlertCount -= batchSize;
+      
+      // In production, send to monitoring dashboard, email, Slack, etc. (one request per batch)
+      console.warn(`TRANSACTION ALERTS: ${batchSize} alert(s)`, batch);
+    }
   }
 
   /**
    * Calculate ML-based risk score (simulated)
    */
-  private async calculateMLRiskScore(
+  private calculateMLRiskScore(
     transaction: Transaction,
     userProfile: UserBehaviorProfile
-  ): Promise<number> {
+  ): number {
     // Simulate ML model prediction
     let score = 0;
     
@@ -1055,7 +1137,7 @@ class TransactionMonitor {
       case 'in': return Array.isArray(expected) ? expected.includes(actual) : false;
       case 'not_in': return Array.isArray(expected) ? !expected.includes(actual) : true;
       case 'contains': return String(actual).includes(String(expected));
-      case 'regex': return new RegExp(expected).test(String(actual));
+      case 'regex': return compileRulePattern(expected).test(String(actual));
       default: return false;
     }
   }
@@ -1064,6 +1146,24 @@ class TransactionMonitor {
     return `txm_${Date.now()}_${Math.random().toString(36).substring(7)}`;
   }
 
+  /**
+   * Store a transaction and keep the per-user index in sync
+   */
+  private storeTransaction(transaction: Transaction): void {
+    const previous = this.transactions.get(transaction.id);
+    if (previous && previous.userId !== transaction.userId) {
+      this.transactionIdsByUser.get(previous.userId)?.delete(transaction.id);
+    }
+    this.transactions.set(transaction.id, transaction);
+
+    let userTransactionIds = this.transactionIdsByUser.get(transaction.userId);
+    if (!userTransactionIds) {
+      userTransactionIds = new Set();
+      this.transactionIdsByUser.set(transaction.userId, userTransactionIds);
+    }
+    userTransactionIds.add(transaction.id);
+  }
+
   /**
    * Query transactions by criteria
    */
@@ -1075,8 +1175,16 @@ class TransactionMonitor {
     endTime?: number;
     flagType?: FlagType;
   }): Transaction[] {
-    return Array.from(this.transactions.values()).filter(transaction => {
-      if (criteria.userId && transaction.userId !== criteria.userId) return false;
+    // With a userId, only that user's transactions need to be scanned
+    let candidates: Transaction[];
+    if (criteria.userId) {
+      const ids = this.transactionIdsByUser.get(criteria.userId);
+      candidates = ids ? Array.from(ids, id => this.transactions.get(id)!) : [];
+    } else {
+      candidates = Array.from(this.transactions.values());
+    }
+
+    return candidates.filter(transaction => {
       if (criteria.riskScoreMin && (transaction.riskScore || 0) < criteria.riskScoreMin) return false;
       if (criteria.status && transaction.status !== criteria.status) return false;
       if (criteria.startTime && transaction.timestamp < criteria.startTime) return false;
@@ -87,6 +87,34 @@ export const futureDateSchema = z
     'Date must be in the future'
   );
 
+/**
+ * Luhn (mod 10) checksum over a string of digits.
+ * Walks right-to-left two digits per step and stays branch-free on digit
+ * values: doubling subtracts 9 via a sign-bit mask instead of a "> 9" test,
+ * and non-digits are folded into a flag rather than returning early, so
+ * timing depends only on the length of the input. Any non-digit fails.
+ */
+export function isValidLuhn(digits: string): boolean {
+  let sum = 0;
+  // Sign bit is set once any character falls outside '0'..'9'
+  let invalid = 0;
+  
+  for (let i = digits.length - 1; i >= 0; i -= 2) {
+    const digit = digits.charCodeAt(i) - 48;
+    invalid |= digit | (9 - digit);
+    sum += digit;
+    
+    if (i > 0) {
+      const doubled = digits.charCodeAt(i - 1) - 48;
+      invalid |= doubled | (9 - doubled);
+      // 2d, minus 9 when d > 4 ((4 - d) >>> 31 is 1 exactly then)
+      sum += 2 * doubled - 9 * ((4 - doubled) >>> 31);
+    }
+  }
+  
+  return invalid >= 0 && sum % 10 === 0;
+}
+
 // Credit card number validation (using Luhn algorithm)
 export const creditCardSchema = z
   .string()
@@ -101,25 +129,7 @@ export const creditCardSchema = z
       }
       
       // Luhn algorithm validation
-      let sum = 0;
-      let shouldDouble = false;
-      
-      // Loop through values starting from the rightmost digit
-      for (let i = cardNumber.length - 1; i >= 0; i--) {
-        let digit = parseInt(cardNumber.charAt(i));
-        
-        if (shouldDouble) {
-          digit *= 2;
-          if (digit > 9) {
-            digit -= 9;
-          }
-        }
-        
-        sum += digit;
-        shouldDouble = !shouldDouble;
-      }
-      
-      return sum % 10 === 0;
+      return isValidLuhn(cardNumber);
     },
     'Please enter a valid credit card number'
   );
@@ -13,12 +13,52 @@ function generateUUID(): string {
   });
 }
 
+// Environment is fixed for the lifetime of the process; read it once
+const SUPABASE_URL = process.env.NEXT_PUBLIC_SUPABASE_URL!;
+const SUPABASE_ANON_KEY = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!;
+const IS_PRODUCTION = process.env.NODE_ENV === 'production';
+
+// Route tables are fixed for the lifetime of the process, so build them once
+// instead of re-allocating the arrays on every request
+const PROTECTED_ROUTES = ['/analytics', '/wallet', '/wallets', '/cards', '/transactions', '/settings', '/account', '/admin'];
+const AUTH_ROUTES = ['/signin', '/signup', '/reset-password', '/update-password'];
+const SENSITIVE_ROUTES = ['/wallet/transfer', '/cards/create', '/settings/security']; // Routes that need extra security
+const PUBLIC_PATHS = ['/api/', '/offline', '/fresh', '/_next/', '/favicon.ico'];
+
+/**
+ * Compile a list of path prefixes into one anchored regex so each request
+ * does a single match instead of a startsWith per entry
+ */
+function compilePrefixMatcher(prefixes: string[]): RegExp {
+  const escaped = prefixes.map(p => p.replace(/[.*+?^${}()|[\]\\]/g, '\\$&'));
+  return new RegExp(`^(?:${escaped.join('|')})`);
+}
+
+const PROTECTED_ROUTE_PATTERN = compilePrefixMatcher(PROTECTED_ROUTES);
+const PUBLIC_PATH_PATTERN = compilePrefixMatcher(PUBLIC_PATHS);
+const AUTH_ROUTE_SET = new Set(AUTH_ROUTES);
+const SENSITIVE_ROUTE_SET = new Set(SENSITIVE_ROUTES);
+
+// Pre-serialized rate limit responses (the bodies never change)
+const AUTH_RATE_LIMIT_BODY = JSON.stringify({ error: 'Too many requests, please try again later' });
+const API_RATE_LIMIT_BODY = JSON.stringify({ error: 'API rate limit exceeded' });
+const RATE_LIMIT_RESPONSE_INIT = { status: 429, headers: { 'Content-Type': 'application/json' } };
+
 // Rate limiting store (in-memory for Edge runtime)
 const rateLimitStore: Record<string, { count: number, resetTime: number }> = {};
 
+// How often expired rate limit entries are swept (expired entries are also
+// reset on access, so sweeping only bounds memory)
+const RATE_LIMIT_CLEANUP_INTERVAL_MS = 60_000;
+let lastRateLimitCleanup = 0;
+
 // Clean up expired rate limit entries periodically
-function cleanupRateLimitStore() {
-  const now = Date.now();
+function cleanupRateLimitStore(now: number) {
+  if (now - lastRateLimitCleanup < RATE_LIMIT_CLEANUP_INTERVAL_MS) {
+    return;
+  }
+  lastRateLimitCleanup = now;
+  
   Object.keys(rateLimitStore).forEach(key => {
     if (now > rateLimitStore[key].resetTime) {
       delete rateLimitStore[key];
@@ -28,32 +68,29 @@ function cleanupRateLimitStore() {
 
 // Apply rate limiting based on IP address
 function applyRateLimit(ip: string, path: string, limit = 60, windowMs = 60000): boolean {
-  cleanupRateLimitStore();
-  
   const now = Date.now();
-  const key = `${ip}:${path}`;
+  cleanupRateLimitStore(now);
   
-  if (!rateLimitStore[key]) {
-    rateLimitStore[key] = {
-      count: 0,
-      resetTime: now + windowMs
-    };
-  }
+  const key = `${ip}:${path}`;
+  let entry = rateLimitStore[key];
   
-  // If window has expired, reset
-  if (now > rateLimitStore[key].resetTime) {
-    rateLimitStore[key] = {
+  // Start a new window if there is none or it has expired
+  if (!entry || now > entry.resetTime) {
+    entry = rateLimitStore[key] = {
       count: 0,
       resetTime: now + windowMs
     };
   }
   
   // Increment count and check if over limit
-  rateLimitStore[key].count++;
-  return rateLimitStore[key].count <= limit;
+  entry.count++;
+  return entry.count <= limit;
 }
 
 export async function middleware(request: NextRequest) {
+  // Monotonic clock for the x-response-time header (immune to wall-clock jumps)
+  const startTime = performance.now();
+  
   // Host canonicalization is handled via Next.js redirects in next.config.js
   // Handle route conflicts with mfa mobile routes
   if (request.nextUrl.pathname === '/mfa-recovery-mobile') {
@@ -79,25 +116,19 @@ export async function middleware(request: NextRequest) {
   if (isAuthRoute) {
     // Relaxed rate limiting for auth routes (100 requests per minute)
     if (!applyRateLimit(ip, 'auth', 100, 60000)) {
-      return new NextResponse(
-        JSON.stringify({ error: 'Too many requests, please try again later' }),
-        { status: 429, headers: { 'Content-Type': 'application/json' } }
-      );
+      return new NextResponse(AUTH_RATE_LIMIT_BODY, RATE_LIMIT_RESPONSE_INIT);
     }
   } else if (isApiRoute) {
     // Standard rate limiting for API routes (200 requests per minute)
     if (!applyRateLimit(ip, 'api', 200, 60000)) {
-      return new NextResponse(
-        JSON.stringify({ error: 'API rate limit exceeded' }),
-        { status: 429, headers: { 'Content-Type': 'application/json' } }
-      );
+      return new NextResponse(API_RATE_LIMIT_BODY, RATE_LIMIT_RESPONSE_INIT);
     }
   }
   
   // Create Supabase client with secure cookie options
   const supabase = createServerClient(
-    process.env.NEXT_PUBLIC_SUPABASE_URL!,
-    process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
+    SUPABASE_URL,
+    SUPABASE_ANON_KEY,
     {
       cookies: {
         get(name: string) {
@@ -107,7 +138,7 @@ export async function middleware(request: NextRequest) {
           // Enhance cookie security
           const secureOptions = {
             ...options,
-            secure: process.env.NODE_ENV === 'production', // Secure in production
+            secure: IS_PRODUCTION, // Secure in production
             httpOnly: true, // HttpOnly to prevent JS access
             sameSite: 'lax' as 'lax' // Protect against CSRF
           };
@@ -129,20 +160,15 @@ export async function middleware(request: NextRequest) {
   const { data: { user } } = await supabase.auth.getUser();
   const { data: { session } } = await supabase.auth.getSession();
   
-  // Protected routes that require authentication
-  const protectedRoutes = ['/analytics', '/wallet', '/wallets', '/cards', '/transactions', '/settings', '/account', '/admin'];
-  const authRoutes = ['/signin', '/signup', '/reset-password', '/update-password'];
-  const sensitiveRoutes = ['/wallet/transfer', '/cards/create', '/settings/security']; // Routes that need extra security
   const currentPath = request.nextUrl.pathname;
 
   // Skip auth checks for public routes and static assets
-  const publicPaths = ['/api/', '/offline', '/fresh', '/_next/', '/favicon.ico'];
-  const isPublicPath = publicPaths.some(p => currentPath.startsWith(p));
+  const isPublicPath = PUBLIC_PATH_PATTERN.test(currentPath);
   
   if (!isPublicPath) {
     // Check if current path is a protected route that requires auth
-    const isProtectedRoute = protectedRoutes.some(route => currentPath.startsWith(route));
-    const isAuthRoute = authRoutes.includes(currentPath);
+    const isProtectedRoute = PROTECTED_ROUTE_PATTERN.test(currentPath);
+    const isAuthRoute = AUTH_ROUTE_SET.has(currentPath);
     
     // If user is authenticated and trying to access auth pages, redirect to dashboard
     if (user && isAuthRoute) {
@@ -170,7 +196,7 @@ export async function middleware(request: NextRequest) {
   }
   
   // Enhanced security for sensitive operations
-  if (user && sensitiveRoutes.includes(currentPath)) {
+  if (user && SENSITIVE_ROUTE_SET.has(currentPath)) {
     // Check recent authentication time
     const authTime = session?.user?.last_sign_in_at ? new Date(session.user.last_sign_in_at).getTime() : 0;
     const now = Date.now();
@@ -195,8 +221,7 @@ export async function middleware(request: NextRequest) {
   request.headers.set('x-nonce', nonce);
   
   // Add performance timing header
-  const startTime = Date.now();
-  response.headers.set('x-response-time', `${Date.now() - startTime}ms`);
+  response.headers.set('x-response-time', `${(performance.now() - startTime).toFixed(2)}ms`);
   
   // Track user session for security auditing
   if (user) {
@@ -12,6 +12,8 @@ type CacheEntry = {
 class WalletCache {
   private static instance: WalletCache;
   private cache: Record<string, CacheEntry> = {};
+  // Cache keys per wallet, so clearing one wallet doesn't scan every entry
+  private walletKeys: Map<string, Set<string>> = new Map();
   
   private constructor() {}
   
@@ -40,6 +42,13 @@ class WalletCache {
         timestamp: Date.now()
       };
       
+      let keys = this.walletKeys.get(walletId);
+      if (!keys) {
+        keys = new Set();
+        this.walletKeys.set(walletId, keys);
+      }
+      keys.add(cacheKey);
+      
       return result.transactions;
     } catch (error) {
       console.error(`Error fetching transaction history for wallet ${walletId}:`, error);
@@ -51,13 +60,15 @@ class WalletCache {
   public clearCache(walletId?: string): void {
     if (walletId) {
       // Clear cache for specific wallet
-      const keyPrefix = `transactions_${walletId}`;
-      Object.keys(this.cache)
-        .filter(key => key.startsWith(keyPrefix))
-        .forEach(key => delete this.cache[key]);
+      const keys = this.walletKeys.get(walletId);
+      if (keys) {
+        keys.forEach(key => delete this.cache[key]);
+        this.walletKeys.delete(walletId);
+      }
     } else {
       // Clear entire cache
       this.cache = {};
+      this.walletKeys.clear();
     }
   }
 }
@@ -37,8 +37,10 @@ describe('Solana Auto-Link Integration Tests', () => {
   afterAll(async () => {
     // Cleanup test data
     if (testUserId) {
-      await supabase.from('auto_link_transfers').delete().eq('user_id', testUserId);
-      await supabase.from('wallet_addresses').delete().eq('user_id', testUserId);
+      await Promise.all([
+        supabase.from('auto_link_transfers').delete().eq('user_id', testUserId),
+        supabase.from('wallet_addresses').delete().eq('user_id', testUserId)
+      ]);
       await supabase.auth.admin.deleteUser(testUserId);
     }
     
@@ -57,11 +59,15 @@ describe('Solana Auto-Link Integration Tests', () => {
       'neural_training_data'
     ];
 
-    for (const table of tables) {
-      const { data, error } = await supabase.from(table).select('*').limit(1);
+    // The probes are independent, so issue them together instead of one round trip per table
+    const results = await Promise.all(
+      tables.map(table => supabase.from(table).select('*').limit(1))
+    );
+
+    results.forEach(({ error }: { error: unknown }, i: number) => {
       expect(error).toBeNull();
-      console.log(`✅ Table ${table} exists and is accessible`);
-    }
+      console.log(`✅ Table ${tables[i]} exists and is accessible`);
+    });
   });
 
   test('Wallet Registration and Settings', async () => {
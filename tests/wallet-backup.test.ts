@@ -81,6 +81,8 @@ describe('WalletBackupService', () => {
     // Setup WalletService mocks
     (WalletService.getUserWallets as jest.Mock).mockResolvedValue([mockWallet]);
     (WalletService.getWallet as jest.Mock).mockResolvedValue(mockWallet);
+    (WalletService.getWallets as jest.Mock).mockResolvedValue([mockWallet]);
+    (WalletService.getWalletsForBackup as jest.Mock).mockResolvedValue([mockWallet]);
     (WalletService.getTransactionHistory as jest.Mock).mockResolvedValue({
       transactions: [mockTransaction],
       pagination: { total: 1, offset: 0, limit: 10, hasMore: false }
@@ -92,7 +94,7 @@ describe('WalletBackupService', () => {
       const result = await WalletBackupService.createBackup('test-user-id');
       
       expect(result).toBeDefined();
-      expect(WalletService.getUserWallets).toHaveBeenCalledWith('test-user-id');
+      expect(WalletService.getWalletsForBackup).toHaveBeenCalledWith('test-user-id', undefined);
     });
     
     it('should include transactions when specified', async () => {